@@ -34,12 +34,15 @@ __docformat__ = "restructuredtext en"
 
 __all__ = ()
 
+import copy
+import functools
 import os
-import yaml
 import logging
 from typing import Any
 
-config: dict[str, Any] = {
+logger = logging.getLogger(__name__)
+
+default_config: dict[str, Any] = {
     "logging": {
         "log_level": logging.INFO,
         "log_file": "logs/log.txt",
@@ -50,26 +53,67 @@ config: dict[str, Any] = {
     "neo4j": {"uri": None, "username": None, "password": None, "dbname": None},
 }
 
-config_file = os.getenv("MALTOOLBOX_CONFIG", "maltoolbox.yml")
 
-if os.path.exists(config_file):
-    with open(config_file) as f:
-        config |= yaml.safe_load(f)
+@functools.cache
+def load_config() -> dict[str, Any]:
+    """Load the maltoolbox configuration
 
-log_configs, neo4j_configs = config.values()
+    The defaults are updated with the contents of the file pointed to by the
+    MALTOOLBOX_CONFIG environment variable (maltoolbox.yml by default) if it
+    exists. The file is only read the first time this is called.
+    """
+    config = copy.deepcopy(default_config)
+    config_file = _config_file_location()
 
-os.makedirs(os.path.dirname(log_configs["log_file"]), exist_ok=True)
+    if os.path.exists(config_file):
+        import yaml
+        with open(config_file) as f:
+            config |= yaml.safe_load(f)
 
-formatter = logging.Formatter(
-    "%(asctime)s %(name)-12s %(levelname)-8s %(message)s", datefmt="%m-%d %H:%M"
-)
-file_handler = logging.FileHandler(log_configs["log_file"], mode="w")
-file_handler.setFormatter(formatter)
+    return config
 
-logger = logging.getLogger(__name__)
-logger.addHandler(file_handler)
 
-logger.setLevel(log_configs.get("log_level"))
-logger.info("Set loggin level of %s to %s.", __name__, log_configs.get("log_level"))
+def _config_file_location() -> str:
+    """Return the path of the maltoolbox configuration file"""
+    return os.getenv("MALTOOLBOX_CONFIG", "maltoolbox.yml")
+
+
+@functools.cache
+def configure_logging() -> None:
+    """Send the maltoolbox logs to the log file given in the configuration
+
+    The command line client calls this on start up. Library users that want
+    the logs written to the configured log file call it themselves, nothing
+    else in maltoolbox does. Only the first call has any effect.
+    """
+    log_configs = load_config()["logging"]
+
+    os.makedirs(os.path.dirname(log_configs["log_file"]), exist_ok=True)
+
+    formatter = logging.Formatter(
+        "%(asctime)s %(name)-12s %(levelname)-8s %(message)s",
+        datefmt="%m-%d %H:%M"
+    )
+    file_handler = logging.FileHandler(log_configs["log_file"], mode="w")
+    file_handler.setFormatter(formatter)
+
+    logger.addHandler(file_handler)
+
+    logger.setLevel(log_configs.get("log_level"))
+    logger.info(
+        "Set loggin level of %s to %s.", __name__, log_configs.get("log_level")
+    )
+    logger.debug("Config file location: %s", _config_file_location())
+
 
-logger.debug("Config file location: %s", config_file)
+def __getattr__(name: str) -> Any:
+    # Keep `config`, `log_configs` and `neo4j_configs` available as module
+    # attributes without reading the config file at import time.
+    match (name):
+        case "config":
+            return load_config()
+        case "log_configs":
+            return load_config()["logging"]
+        case "neo4j_configs":
+            return load_config()["neo4j"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
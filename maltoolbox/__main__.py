@@ -27,10 +27,9 @@ import logging
 import json
 import docopt
 
-from . import log_configs, neo4j_configs
+from . import configure_logging, load_config
 from .attackgraph import create_attack_graph
 from .language.compiler import MalCompiler
-from .ingestors import neo4j
 from .language.languagegraph import LanguageGraph
 from .translators.updater import load_model_from_older_version
 
@@ -48,6 +47,7 @@ def generate_attack_graph(
     lang_file       - path to the language file
     send_to_neo4j   - whether to ingest into neo4j or not
     """
+    log_configs = load_config()['logging']
     attack_graph = create_attack_graph(lang_file, model_file)
     if log_configs['attackgraph_file']:
         attack_graph.save_to_file(
@@ -55,6 +55,10 @@ def generate_attack_graph(
         )
 
     if send_to_neo4j:
+        # py2neo is only needed when actually ingesting into Neo4j
+        from .ingestors import neo4j
+        neo4j_configs = load_config()['neo4j']
+
         logger.debug('Ingest model graph into Neo4J database.')
         neo4j.ingest_model(
             attack_graph.model,
@@ -83,6 +87,7 @@ def compile(lang_file: str, output_file: str) -> None:
 
 
 def upgrade_model(model_file: str, lang_file: str, output_file: str):
+    log_configs = load_config()['logging']
     lang_graph = LanguageGraph.load_from_file(lang_file)
 
     if log_configs['langspec_file']:
@@ -94,6 +99,7 @@ def upgrade_model(model_file: str, lang_file: str, output_file: str):
 
 def main():
     args = docopt.docopt(__doc__)
+    configure_logging()
 
     if args['attack-graph'] and args['generate']:
         generate_attack_graph(
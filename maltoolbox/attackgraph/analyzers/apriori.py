@@ -16,6 +16,7 @@ from typing import Optional, TYPE_CHECKING
 import logging
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from ..attackgraph import AttackGraph
     from ..node import AttackGraphNode
 
@@ -31,17 +32,29 @@ def propagate_viability_from_node(node: AttackGraphNode) -> None:
         'Propagate viability from "%s"(%d) with viability status %s.',
         node.full_name, node.id, node.is_viable
     )
-    for child in node.children:
+    # Depth first walk with an explicit stack of children iterators, in the
+    # same order as recursing into each changed child would, but without
+    # being bound by the recursion limit on long attack paths.
+    children_to_visit = [iter(node.children)]
+    while children_to_visit:
+        child = next(children_to_visit[-1], None)
+        if child is None:
+            children_to_visit.pop()
+            continue
+
         original_value = child.is_viable
         if child.type == 'or':
-            child.is_viable = False
-            for parent in child.parents:
-                child.is_viable = child.is_viable or parent.is_viable
+            child.is_viable = any(
+                parent.is_viable for parent in child.parents)
         if child.type == 'and':
             child.is_viable = False
 
         if child.is_viable != original_value:
-            propagate_viability_from_node(child)
+            logger.debug(
+                'Propagate viability from "%s"(%d) with viability status %s.',
+                child.full_name, child.id, child.is_viable
+            )
+            children_to_visit.append(iter(child.children))
 
 
 def propagate_necessity_from_node(node: AttackGraphNode) -> None:
@@ -55,7 +68,15 @@ def propagate_necessity_from_node(node: AttackGraphNode) -> None:
         node.full_name, node.id, node.is_necessary
     )
 
-    for child in node.children:
+    # Depth first walk with an explicit stack, see
+    # propagate_viability_from_node
+    children_to_visit = [iter(node.children)]
+    while children_to_visit:
+        child = next(children_to_visit[-1], None)
+        if child is None:
+            children_to_visit.pop()
+            continue
+
         if child.ttc and child.ttc.get('name', None) not in ['Enabled',
                 'Disabled', 'Instant']:
             # Do not propagate unnecessary state from nodes that have a TTC
@@ -69,14 +90,17 @@ def propagate_necessity_from_node(node: AttackGraphNode) -> None:
         if child.type == 'or':
             child.is_necessary = False
         if child.type == 'and':
-            child.is_necessary = False
-            for parent in child.parents:
-                child.is_necessary = child.is_necessary or parent.is_necessary
+            child.is_necessary = any(
+                parent.is_necessary for parent in child.parents)
 
         # TODO: Update TTC for child attack step before if it is not necessary
         # before propagating it further.
         if child.is_necessary != original_value:
-            propagate_necessity_from_node(child)
+            logger.debug(
+                'Propagate necessity from "%s"(%d) with necessity status %s.',
+                child.full_name, child.id, child.is_necessary
+            )
+            children_to_visit.append(iter(child.children))
 
 
 def evaluate_viability(node: AttackGraphNode) -> None:
@@ -99,13 +123,11 @@ def evaluate_viability(node: AttackGraphNode) -> None:
                 f'{node.full_name} defense status invalid: {node.defense_status}.'
             node.is_viable = node.defense_status != 1.0
         case 'or':
-            node.is_viable = False
-            for parent in node.parents:
-                node.is_viable = node.is_viable or parent.is_viable
+            node.is_viable = any(
+                parent.is_viable for parent in node.parents)
         case 'and':
-            node.is_viable = True
-            for parent in node.parents:
-                node.is_viable = node.is_viable and parent.is_viable
+            node.is_viable = all(
+                parent.is_viable for parent in node.parents)
         case _:
             msg = ('Evaluate viability was provided node "%s"(%d) which '
                    'is of unknown type "%s"')
@@ -133,13 +155,11 @@ def evaluate_necessity(node: AttackGraphNode) -> None:
                 f'{node.full_name} defense status invalid: {node.defense_status}.'
             node.is_necessary = node.defense_status != 0.0
         case 'or':
-            node.is_necessary = True
-            for parent in node.parents:
-                node.is_necessary = node.is_necessary and parent.is_necessary
+            node.is_necessary = all(
+                parent.is_necessary for parent in node.parents)
         case 'and':
-            node.is_necessary = False
-            for parent in node.parents:
-                node.is_necessary = node.is_necessary or parent.is_necessary
+            node.is_necessary = any(
+                parent.is_necessary for parent in node.parents)
         case _:
             msg = ('Evaluate necessity was provided node "%s"(%d) which '
                    'is of unknown type "%s"')
@@ -200,7 +220,7 @@ def propagate_viability_from_unviable_node(
     `unviable_node` in the graph and return any attack steps
     that are no longer viable because of it.
 
-    Propagate recursively via children as long as changes occur.
+    Propagate via children as long as changes occur.
 
     Arguments:
     unviable_node               - the node to propagate viability from
@@ -208,36 +228,45 @@ def propagate_viability_from_unviable_node(
     Returns:
     attack_steps_made_unviable  - set of the attack steps that have been
                                   made unviable by a defense enabled in the
-                                  current step. Builds up recursively.
+                                  current step.
     """
 
-    attack_steps_made_unviable = set()
-
-    logger.debug(
-        'Update viability for node "%s"(%d)',
-        unviable_node.full_name,
-        unviable_node.id
-    )
-
-    assert not unviable_node.is_viable, (
-        "propagate_viability_from_unviable_node should not be called"
-       f" on viable node {unviable_node.full_name}"
-    )
-
-    if unviable_node.type in ('and', 'or'):
-        attack_steps_made_unviable.add(unviable_node)
+    # All of the affected attack steps are collected in this one set while
+    # walking depth first with an explicit stack of children iterators.
+    attack_steps_made_unviable: set[AttackGraphNode] = set()
+    children_to_visit: list[Iterator[AttackGraphNode]] = []
+
+    node: Optional[AttackGraphNode] = unviable_node
+    while children_to_visit or node is not None:
+        if node is not None:
+            logger.debug(
+                'Update viability for node "%s"(%d)',
+                node.full_name,
+                node.id
+            )
+
+            assert not node.is_viable, (
+                "propagate_viability_from_unviable_node should not be called"
+               f" on viable node {node.full_name}"
+            )
+
+            if node.type in ('and', 'or'):
+                attack_steps_made_unviable.add(node)
+            children_to_visit.append(iter(node.children))
+
+        child = next(children_to_visit[-1], None)
+        if child is None:
+            children_to_visit.pop()
+            node = None
+            continue
 
-    for child in unviable_node.children:
         original_value = child.is_viable
         if child.type == 'or':
-            child.is_viable = False
-            for parent in child.parents:
-                child.is_viable = child.is_viable or parent.is_viable
+            child.is_viable = any(
+                parent.is_viable for parent in child.parents)
         if child.type == 'and':
             child.is_viable = False
 
-        if child.is_viable != original_value:
-            attack_steps_made_unviable |= \
-                propagate_viability_from_unviable_node(child)
+        node = child if child.is_viable != original_value else None
 
     return attack_steps_made_unviable
@@ -8,6 +8,7 @@ import logging
 from typing import Optional
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from .attackgraph import AttackGraphNode
 
 logger = logging.getLogger(__name__)
@@ -63,7 +64,7 @@ class Attacker:
             node.full_name,
             node.id
         )
-        if node.is_compromised_by(self):
+        if node in self.reached_attack_steps:
             logger.info(
                 'Attacker "%s"(%d) already compromised node "%s"(%d). '
                 'Do nothing.',
@@ -94,7 +95,7 @@ class Attacker:
             node.full_name,
             node.id
         )
-        if not node.is_compromised_by(self):
+        if node not in self.reached_attack_steps:
             logger.info(
                 'Attacker "%s"(%d) had not compromised node "%s"(%d).'
                 ' Do nothing.',
@@ -107,3 +108,39 @@ class Attacker:
 
         node.compromised_by.remove(self)
         self.reached_attack_steps.remove(node)
+
+    def compromise_many(self, nodes: Iterable[AttackGraphNode]) -> None:
+        """
+        Have the attacker compromise all of the nodes given as a parameter.
+
+        Nodes that were already compromised by the attacker are left as they
+        are, without the per node logging of compromise.
+
+        Arguments:
+        nodes   - the nodes that the attacker will compromise
+        """
+
+        logger.debug(
+            'Attacker "%s"(%s) is compromising multiple nodes.',
+            self.name,
+            self.id
+        )
+        for node in nodes:
+            node.compromised_by.add(self)
+            self.reached_attack_steps.add(node)
+
+    def undo_all_compromises(self) -> None:
+        """
+        Remove the attacker from the list of attackers that have compromised
+        each of the nodes it has reached, leaving it with no reached nodes.
+        """
+
+        logger.debug(
+            'Removing attacker "%s"(%s) from compromised_by '
+            'list of all of its reached nodes.',
+            self.name,
+            self.id
+        )
+        for node in self.reached_attack_steps:
+            node.compromised_by.discard(self)
+        self.reached_attack_steps.clear()
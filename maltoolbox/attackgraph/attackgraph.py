@@ -14,7 +14,7 @@ from typing import TYPE_CHECKING
 from .analyzers.apriori import calculate_viability_and_necessity
 from .node import AttackGraphNode
 from .attacker import Attacker
-from .. import log_configs
+from .. import load_config
 from ..exceptions import AttackGraphStepExpressionError, AttackGraphException
 from ..exceptions import LanguageGraphException
 from ..model import Model
@@ -23,16 +23,45 @@ from ..language import (LanguageGraph, ExpressionsChain,
 from ..file_utils import (
     load_dict_from_json_file,
     load_dict_from_yaml_file,
+    save_dict_items_to_json_file,
     save_dict_to_file
 )
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from typing import Any, Optional
     from ..model import ModelAsset
 
 logger = logging.getLogger(__name__)
 
+# Node flags are saved as json/yaml booleans, attack graphs saved by earlier
+# versions stored them as strings.
+_SERIALIZED_BOOLS = {True: True, False: False, 'True': True, 'False': False}
+
+
+def _load_node_flag(node_dict: dict, flag_name: str, default: bool) -> bool:
+    """Read a boolean node flag from a serialized attack graph node
+
+    Arguments:
+    node_dict   - the serialized node
+    flag_name   - the key of the flag in the serialized node
+    default     - the value to use if the flag is not in the serialized node
+
+    Return:
+    The flag as a bool, raises AttackGraphException if it has another value
+    """
+    value = node_dict.get(flag_name, default)
+    flag = _SERIALIZED_BOOLS.get(value) \
+        if isinstance(value, (bool, str)) else None
+    if flag is None:
+        msg = ('Invalid value %r for "%s" of node with id %s when loading'
+               ' attack graph from dict')
+        logger.error(msg, value, flag_name, node_dict['id'])
+        raise AttackGraphException(
+            msg % (value, flag_name, node_dict['id']))
+    return flag
+
 
 def create_attack_graph(
         lang_file: str,
@@ -48,6 +77,8 @@ def create_attack_graph(
     attach_attackers                - whether to run attach_attackers or not
     calc_viability_and_necessity    - whether run apriori calculations or not
     """
+    log_configs = load_config()['logging']
+
     try:
         lang_graph = LanguageGraph.from_mar_archive(lang_file)
     except zipfile.BadZipFile:
@@ -87,6 +118,10 @@ class AttackGraph():
         # Dictionaries used in optimization to get nodes and attackers by id
         # or full name faster
         self._full_name_to_node: dict[str, AttackGraphNode] = {}
+        # Nodes by model asset and attack step name, used while generating
+        # the graph to find link targets without building their full names
+        self._asset_step_to_node: \
+            dict[tuple[ModelAsset, str], AttackGraphNode] = {}
 
         self.model = model
         self.lang_graph = lang_graph
@@ -108,8 +143,8 @@ class AttackGraph():
                 ag_node.to_dict()
         for attacker in self.attackers.values():
             serialized_attackers[attacker.name] = attacker.to_dict()
-        logger.debug('Serialized %d attack steps and %d attackers.' %
-            (len(self.nodes), len(self.attackers))
+        logger.debug('Serialized %d attack steps and %d attackers.',
+            len(self.nodes), len(self.attackers)
         )
         return {
             'attack_steps': serialized_attack_steps,
@@ -150,9 +185,17 @@ class AttackGraph():
                 memo[id(node)].compromised_by = copy.deepcopy(
                     node.compromised_by, memo)
 
-        # Copy lookup dicts
-        copied_attackgraph._full_name_to_node = \
-            copy.deepcopy(self._full_name_to_node, memo)
+        # Rebuild the lookup dicts against the copied nodes. Their keys are
+        # immutable and the model is shared with the copy, so only the nodes
+        # need to be swapped.
+        copied_attackgraph._full_name_to_node = {
+            full_name: memo[id(node)]
+            for full_name, node in self._full_name_to_node.items()
+        }
+        copied_attackgraph._asset_step_to_node = {
+            key: memo[id(node)]
+            for key, node in self._asset_step_to_node.items()
+        }
 
         # Copy counters
         copied_attackgraph.next_node_id = self.next_node_id
@@ -163,6 +206,15 @@ class AttackGraph():
     def save_to_file(self, filename: str) -> None:
         """Save to json/yml depending on extension"""
         logger.debug('Save attack graph to file "%s".', filename)
+        if filename.endswith('.json'):
+            # Write the nodes and attackers one at a time instead of
+            # building the whole serialized graph first.
+            return save_dict_items_to_json_file(filename, {
+                'attack_steps': ((ag_node.full_name, ag_node.to_dict())
+                    for ag_node in self.nodes.values()),
+                'attackers': ((attacker.name, attacker.to_dict())
+                    for attacker in self.attackers.values()),
+            })
         return save_dict_to_file(filename, self._to_dict())
 
     @classmethod
@@ -183,7 +235,11 @@ class AttackGraph():
         serialized_attack_steps = serialized_object['attack_steps']
         serialized_attackers = serialized_object['attackers']
 
-        # Create all of the nodes in the imported attack graph.
+        # Create all of the nodes in the imported attack graph. The nodes of
+        # each asset are gathered here and assigned to the asset once all of
+        # them are created, the same way _generate_graph does.
+        attack_step_nodes_by_asset: dict[ModelAsset, list[AttackGraphNode]] \
+            = {}
         for node_dict in serialized_attack_steps.values():
 
             # Recreate asset links if model is available.
@@ -201,52 +257,62 @@ class AttackGraph():
                     node_dict['lang_graph_attack_step'])
             lg_attack_step = lang_graph.assets[lg_asset_name].\
                 attack_steps[lg_attack_step_name]
+            defense_status = node_dict.get('defense_status')
+            existence_status = node_dict.get('existence_status')
             ag_node = attack_graph.add_node(
                 lg_attack_step = lg_attack_step,
                 node_id = node_dict['id'],
                 model_asset = node_asset,
-                defense_status = node_dict.get('defense_status', None),
-                existence_status = node_dict.get('existence_status', None)
+                defense_status = float(defense_status)
+                    if defense_status is not None else None,
+                existence_status = _load_node_flag(
+                    node_dict, 'existence_status', False)
+                    if existence_status is not None else None
             )
+            ag_node.is_viable = _load_node_flag(node_dict, 'is_viable', True)
+            ag_node.is_necessary = \
+                _load_node_flag(node_dict, 'is_necessary', True)
             ag_node.tags = set(node_dict.get('tags', []))
             ag_node.extras = node_dict.get('extras', {})
 
             if node_asset:
-                # Add AttackGraphNode to attack_step_nodes of asset
-                if hasattr(node_asset, 'attack_step_nodes'):
-                    node_attack_steps = list(node_asset.attack_step_nodes)
-                    node_attack_steps.append(ag_node)
-                    node_asset.attack_step_nodes = node_attack_steps
-                else:
-                    node_asset.attack_step_nodes = [ag_node]
+                attack_step_nodes_by_asset.setdefault(
+                    node_asset, []).append(ag_node)
 
+        for node_asset, attack_step_nodes in \
+                attack_step_nodes_by_asset.items():
+            node_asset.attack_step_nodes = attack_step_nodes
 
         # Re-establish links between nodes.
         for node_dict in serialized_attack_steps.values():
-            _ag_node = attack_graph.nodes[node_dict['id']]
+            _ag_node = attack_graph.nodes.get(node_dict['id'])
             if not isinstance(_ag_node, AttackGraphNode):
                 msg = ('Failed to find node with id %s when loading'
                        ' attack graph from dict')
                 logger.error(msg, node_dict["id"])
                 raise LookupError(msg % node_dict["id"])
             else:
+                children = []
                 for child_id in node_dict['children']:
-                    child = attack_graph.nodes[int(child_id)]
+                    child = attack_graph.nodes.get(int(child_id))
                     if child is None:
                         msg = ('Failed to find child node with id %s'
                                ' when loading from attack graph from dict')
                         logger.error(msg, child_id)
                         raise LookupError(msg % child_id)
-                    _ag_node.children.add(child)
+                    children.append(child)
+                _ag_node.children.update(children)
 
+                parents = []
                 for parent_id in node_dict['parents']:
-                    parent = attack_graph.nodes[int(parent_id)]
+                    parent = attack_graph.nodes.get(int(parent_id))
                     if parent is None:
                         msg = ('Failed to find parent node with id %s '
                                'when loading from attack graph from dict')
                         logger.error(msg, parent_id)
                         raise LookupError(msg % parent_id)
-                    _ag_node.parents.add(parent)
+                    parents.append(parent)
+                _ag_node.parents.update(parents)
 
         for attacker in serialized_attackers.values():
             ag_attacker = Attacker(name = attacker['name'])
@@ -300,8 +366,6 @@ class AttackGraph():
         Return:
         The attack step node that matches the given full name.
         """
-
-        logger.debug(f'Looking up node with full name "%s"', full_name)
         return self._full_name_to_node.get(full_name)
 
     def attach_attackers(self) -> None:
@@ -329,20 +393,22 @@ class AttackGraph():
             attacker = Attacker(name = attacker_info.name)
             self.add_attacker(attacker)
 
+            entry_points = set()
             for (asset, attack_steps) in attacker_info.entry_points:
                 for attack_step in attack_steps:
-                    full_name = asset.name + ':' + attack_step
-                    ag_node = self.get_node_by_full_name(full_name)
+                    ag_node = self._asset_step_to_node.get(
+                        (asset, attack_step))
                     if not ag_node:
                         logger.warning(
                             'Failed to find attacker entry point '
-                            '%s for %s.',
-                            full_name, attacker.name
+                            '%s:%s for %s.',
+                            asset.name, attack_step, attacker.name
                         )
                         continue
-                    attacker.compromise(ag_node)
+                    entry_points.add(ag_node)
 
-            attacker.entry_points = set(attacker.reached_attack_steps)
+            attacker.entry_points.update(entry_points)
+            attacker.compromise_many(entry_points)
 
     def _follow_expr_chain(
             self,
@@ -379,6 +445,56 @@ class AttackGraph():
             )
 
         match (expr_chain.type):
+            # The cases are ordered by how often they are encountered in
+            # typical languages.
+            case 'field':
+                # Change the target assets from the current ones to the
+                # associated assets given the specified field name.
+                if not expr_chain.fieldname:
+                    raise LanguageGraphException('"field" step expression '
+                        'chain is missing fieldname.')
+                # Each asset keeps its associated assets indexed by field
+                # name, so this is one dict lookup per target asset.
+                fieldname = expr_chain.fieldname
+                new_target_assets = set()
+                for asset in target_assets:
+                    associated_assets = \
+                        asset.associated_assets.get(fieldname)
+                    if associated_assets:
+                        new_target_assets |= associated_assets
+                return new_target_assets
+
+            case 'collect':
+                if not expr_chain.left_link:
+                    raise LanguageGraphException('"collect" step expression chain'
+                        ' is missing the left link.')
+                if not expr_chain.right_link:
+                    raise LanguageGraphException('"collect" step expression chain'
+                        ' is missing the right link.')
+                lh_targets = self._follow_expr_chain(
+                    model,
+                    target_assets,
+                    expr_chain.left_link
+                )
+                if expr_chain.right_link.is_distributive:
+                    # Following the right hand link from all of the left hand
+                    # targets at once gives the same result as following it
+                    # from each one of them separately.
+                    return self._follow_expr_chain(
+                        model,
+                        lh_targets,
+                        expr_chain.right_link
+                    )
+
+                rh_targets = set()
+                for lh_target in lh_targets:
+                    rh_targets |= self._follow_expr_chain(
+                        model,
+                        {lh_target},
+                        expr_chain.right_link
+                    )
+                return rh_targets
+
             case 'union' | 'intersection' | 'difference':
                 # The set operators are used to combine the left hand and
                 # right hand targets accordingly.
@@ -399,104 +515,57 @@ class AttackGraph():
                     expr_chain.right_link
                 )
 
+                # Model assets are hashable so the targets are combined with
+                # plain set operations, O(len(lh) + len(rh)).
                 match (expr_chain.type):
-                    # Once the assets become hashable set operations should be
-                    # used instead.
                     case 'union':
-                        new_target_assets = lh_targets.union(rh_targets)
+                        return lh_targets | rh_targets
 
                     case 'intersection':
-                        new_target_assets = lh_targets.intersection(rh_targets)
-
-                    case 'difference':
-                        new_target_assets = lh_targets.difference(rh_targets)
-
-                return new_target_assets
+                        return lh_targets & rh_targets
 
-            case 'field':
-                # Change the target assets from the current ones to the
-                # associated assets given the specified field name.
-                if not expr_chain.fieldname:
-                    raise LanguageGraphException('"field" step expression '
-                        'chain is missing fieldname.')
-                new_target_assets = set()
-                new_target_assets.update(
-                    *(
-                        asset.associated_assets.get(
-                            expr_chain.fieldname, set()
-                        ) for asset in target_assets
-                      )
-                )
-                return new_target_assets
+                    case _:
+                        return lh_targets - rh_targets
 
             case 'transitive':
                 if not expr_chain.sub_link:
                     raise LanguageGraphException('"transitive" step '
                         'expression chain is missing sub link.')
 
-                new_assets = target_assets
-
-                while new_assets := self._follow_expr_chain(
-                    model, new_assets, expr_chain.sub_link
-                ):
-                    if not (new_assets := new_assets.difference(target_assets)):
-                        break
-
-                    target_assets.update(new_assets)
+                # Breadth first search from the target assets. Only the
+                # assets reached for the first time are expanded in the next
+                # round, so each asset is followed at most once and cycles
+                # terminate. The caller's set is left untouched.
+                reached_assets = set(target_assets)
+                frontier = reached_assets
+                while frontier := self._follow_expr_chain(
+                    model, frontier, expr_chain.sub_link
+                ) - reached_assets:
+                    reached_assets |= frontier
 
-                return target_assets
+                return reached_assets
 
             case 'subType':
                 if not expr_chain.sub_link:
                     raise LanguageGraphException('"subType" step '
                         'expression chain is missing sub link.')
-                new_target_assets = set()
-                new_target_assets.update(
-                    self._follow_expr_chain(
-                        model, target_assets, expr_chain.sub_link
+                lang_graph_subtype_asset = expr_chain.subtype
+                if not lang_graph_subtype_asset:
+                    raise LookupError(
+                        'Failed to find asset "%s" in the '
+                        'language graph.' % expr_chain.subtype
                     )
+                new_target_assets = self._follow_expr_chain(
+                    model, target_assets, expr_chain.sub_link
                 )
 
-                selected_new_target_assets = set()
-                for asset in new_target_assets:
-                    lang_graph_asset = self.lang_graph.assets[asset.type]
-                    if not lang_graph_asset:
-                        raise LookupError(
-                            f'Failed to find asset \"{asset.type}\" in the '
-                            'language graph.'
-                        )
-                    lang_graph_subtype_asset = expr_chain.subtype
-                    if not lang_graph_subtype_asset:
-                        raise LookupError(
-                            'Failed to find asset "%s" in the '
-                            'language graph.' % expr_chain.subtype
-                        )
-                    if lang_graph_asset.is_subasset_of(
-                            lang_graph_subtype_asset):
-                        selected_new_target_assets.add(asset)
-
-                return selected_new_target_assets
-
-            case 'collect':
-                if not expr_chain.left_link:
-                    raise LanguageGraphException('"collect" step expression chain'
-                        ' is missing the left link.')
-                if not expr_chain.right_link:
-                    raise LanguageGraphException('"collect" step expression chain'
-                        ' is missing the right link.')
-                lh_targets = self._follow_expr_chain(
-                    model,
-                    target_assets,
-                    expr_chain.left_link
-                )
-                rh_targets = set()
-                for lh_target in lh_targets:
-                    rh_targets |= self._follow_expr_chain(
-                        model,
-                        {lh_target},
-                        expr_chain.right_link
-                    )
-                return rh_targets
+                # The names of the assets each asset type extends are cached
+                # on the language graph asset, so checking each target is a
+                # set lookup instead of a walk up its inheritance chain.
+                return {
+                    asset for asset in new_target_assets
+                    if asset.lg_asset.is_subasset_of(lang_graph_subtype_asset)
+                }
 
             case _:
                 msg = 'Unknown attack expressions chain type: %s'
@@ -520,6 +589,11 @@ class AttackGraph():
             logger.error(msg)
             raise AttackGraphException(msg)
 
+        # Nodes created in the first pass, paired with their asset, whose
+        # children are resolved once all of the nodes exist.
+        pending_links: list[tuple[AttackGraphNode, set[ModelAsset]]] = []
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
         # First, generate all of the nodes of the attack graph.
         for asset in self.model.assets.values():
 
@@ -529,23 +603,26 @@ class AttackGraph():
             )
 
             attack_step_nodes = []
+            # Following an expressions chain does not modify the assets it
+            # starts from, so one set per asset serves all of its steps.
+            asset_targets = {asset}
 
             for attack_step in asset.lg_asset.attack_steps.values():
-                logger.debug(
-                    'Generating attack step node for %s.', attack_step.name
-                )
+                if debug_enabled:
+                    logger.debug(
+                        'Generating attack step node for %s.',
+                        attack_step.name
+                    )
 
                 defense_status = None
                 existence_status = None
-                node_name = asset.name + ':' + attack_step.name
-
                 match (attack_step.type):
                     case 'defense':
                         # Set the defense status for defenses
                         defense_status = asset.defenses[attack_step.name]
                         logger.debug(
-                            'Setting the defense status of \"%s\" to "%s".',
-                            node_name, defense_status
+                            'Setting the defense status of \"%s:%s\" to "%s".',
+                            asset.name, attack_step.name, defense_status
                         )
 
                     case 'exist' | 'notExist':
@@ -555,7 +632,7 @@ class AttackGraph():
                         for requirement in attack_step.requires:
                             target_assets = self._follow_expr_chain(
                                     self.model,
-                                    set([asset]),
+                                    asset_targets,
                                     requirement
                                 )
                             # If the step expression resolution yielded
@@ -566,9 +643,9 @@ class AttackGraph():
                                 break
 
                         logger.debug(
-                            'Setting the existence status of \"%s\" to '
+                            'Setting the existence status of \"%s:%s\" to '
                             '%s.',
-                            node_name, existence_status
+                            asset.name, attack_step.name, existence_status
                         )
 
                     case _:
@@ -581,42 +658,45 @@ class AttackGraph():
                     existence_status = existence_status
                 )
                 attack_step_nodes.append(ag_node)
+                pending_links.append((ag_node, asset_targets))
 
             asset.attack_step_nodes = attack_step_nodes
 
-        # Then, link all of the nodes according to their associations.
-        for ag_node in self.nodes.values():
-            logger.debug(
-                'Determining children for attack step "%s"(%d)',
-                ag_node.full_name,
-                ag_node.id
-            )
-
-            if not ag_node.model_asset:
-                raise AttackGraphException('Attack graph node is missing '
-                    'asset link')
-            lang_graph_asset = self.lang_graph.assets[
-                ag_node.model_asset.type]
+        # Then, link all of the nodes according to their associations. The
+        # lookups used for every edge are bound to locals once up front.
+        model = self.model
+        follow_expr_chain = self._follow_expr_chain
+        get_node_by_asset_step = self._asset_step_to_node.get
+        for ag_node, asset_targets in pending_links:
+            if debug_enabled:
+                logger.debug(
+                    'Determining children for attack step "%s"(%d)',
+                    ag_node.full_name,
+                    ag_node.id
+                )
 
-            lang_graph_attack_step = lang_graph_asset.attack_steps[
-                ag_node.name]
+            # Collect the children of the node first and link them in bulk
+            children: set[AttackGraphNode] = set()
+            lang_graph_attack_step = ag_node.lg_attack_step
 
             while lang_graph_attack_step:
                 for child in lang_graph_attack_step.children.values():
                     for target_attack_step, expr_chain in child:
-                        target_assets = self._follow_expr_chain(
-                            self.model,
-                            set([ag_node.model_asset]),
+                        target_assets = follow_expr_chain(
+                            model,
+                            asset_targets,
                             expr_chain
                         )
 
                         for target_asset in target_assets:
                             if target_asset is not None:
-                                target_node_full_name = target_asset.name + \
-                                    ':' + target_attack_step.name
-                                target_node = self.get_node_by_full_name(
-                                    target_node_full_name)
+                                target_node = get_node_by_asset_step(
+                                    (target_asset, target_attack_step.name))
                                 if target_node is None:
+                                    target_node_full_name = (
+                                        f'{target_asset.name}:'
+                                        f'{target_attack_step.name}'
+                                    )
                                     msg = ('Failed to find target node '
                                            '"%s" to link with for attack '
                                            'step "%s"(%d)!')
@@ -637,21 +717,23 @@ class AttackGraph():
                                 assert ag_node.id is not None
                                 assert target_node.id is not None
 
-                                logger.debug('Linking attack step "%s"(%d) '
-                                    'to attack step "%s"(%d)' %
-                                    (
+                                if debug_enabled:
+                                    logger.debug('Linking attack step '
+                                        '"%s"(%d) to attack step "%s"(%d)',
                                         ag_node.full_name,
                                         ag_node.id,
                                         target_node.full_name,
                                         target_node.id
                                     )
-                                )
-                                ag_node.children.add(target_node)
-                                target_node.parents.add(ag_node)
+                                children.add(target_node)
                 if lang_graph_attack_step.overrides:
                     break
                 lang_graph_attack_step = lang_graph_attack_step.inherits
 
+            ag_node.children.update(children)
+            for child_node in children:
+                child_node.parents.add(ag_node)
+
 
     def regenerate_graph(self) -> None:
         """
@@ -661,6 +743,8 @@ class AttackGraph():
 
         self.nodes = {}
         self.attackers = {}
+        self._full_name_to_node = {}
+        self._asset_step_to_node = {}
         self._generate_graph()
 
     def add_node(
@@ -697,16 +781,11 @@ class AttackGraph():
         node_id = node_id if node_id is not None else self.next_node_id
         if node_id in self.nodes:
             raise ValueError(f'Node index {node_id} already in use.')
-        self.next_node_id = max(node_id + 1, self.next_node_id)
-
-        if logger.isEnabledFor(logging.DEBUG):
-            # Avoid running json.dumps when not in debug
-            logger.debug('Create and add to attackgraph node of type "%s" '
-                'with id:%d.\n' % (
-                    lg_attack_step.full_name,
-                    node_id
-                ))
+        if node_id >= self.next_node_id:
+            self.next_node_id = node_id + 1
 
+        logger.debug('Create and add to attackgraph node of type "%s" '
+            'with id:%d.', lg_attack_step.full_name, node_id)
 
         node = AttackGraphNode(
             node_id = node_id,
@@ -718,6 +797,8 @@ class AttackGraph():
 
         self.nodes[node_id] = node
         self._full_name_to_node[node.full_name] = node
+        if model_asset is not None:
+            self._asset_step_to_node[(model_asset, node.name)] = node
 
         return node
 
@@ -726,25 +807,28 @@ class AttackGraph():
         Arguments:
         node    - the node we wish to remove from the attack graph
         """
-        if logger.isEnabledFor(logging.DEBUG):
-            # Avoid running json.dumps when not in debug
-            logger.debug(f'Remove node "%s"(%d).', node.full_name, node.id)
+        logger.debug('Remove node "%s"(%d).', node.full_name, node.id)
+        if not isinstance(node.id, int):
+            raise ValueError(f'Invalid node id: {node.id}')
+
+        # Children and parents are sets, so unlinking the node costs one
+        # hash removal per neighbour.
         for child in node.children:
             child.parents.remove(node)
         for parent in node.parents:
             parent.children.remove(node)
 
-        if not isinstance(node.id, int):
-            raise ValueError(f'Invalid node id.')
         del self.nodes[node.id]
         del self._full_name_to_node[node.full_name]
+        if node.model_asset is not None:
+            self._asset_step_to_node.pop((node.model_asset, node.name), None)
 
     def add_attacker(
             self,
             attacker: Attacker,
             attacker_id: Optional[int] = None,
-            entry_points: list[int] = [],
-            reached_attack_steps: list[int] = []
+            entry_points: Iterable[int] = (),
+            reached_attack_steps: Iterable[int] = ()
         ):
         """Add an attacker to the graph
         Arguments:
@@ -752,40 +836,42 @@ class AttackGraph():
         attacker_id             - the id to assign to this attacker, usually
                                   used when loading an attack graph from a
                                   file
-        entry_points            - list of attack step ids that serve as entry
-                                  points for the attacker
-        reached_attack_steps    - list of ids of the attack steps that the
-                                  attacker has reached
+        entry_points            - ids of the attack steps that serve as
+                                  entry points for the attacker
+        reached_attack_steps    - ids of the attack steps that the attacker
+                                  has reached
         """
 
-        if logger.isEnabledFor(logging.DEBUG):
-            # Avoid running json.dumps when not in debug
-            if attacker_id is not None:
-                logger.debug('Add attacker "%s" with id:%d.',
-                    attacker.name,
-                    attacker_id
-                )
-            else:
-                logger.debug('Add attacker "%s" without id.',
-                    attacker.name
-                )
+        if attacker_id is not None:
+            logger.debug('Add attacker "%s" with id:%d.',
+                attacker.name,
+                attacker_id
+            )
+        else:
+            logger.debug('Add attacker "%s" without id.',
+                attacker.name
+            )
 
         attacker.id = attacker_id or self.next_attacker_id
         if attacker.id in self.attackers:
             raise ValueError(f'Attacker index {attacker_id} already in use.')
 
-        self.next_attacker_id = max(attacker.id + 1, self.next_attacker_id)
+        if attacker.id >= self.next_attacker_id:
+            self.next_attacker_id = attacker.id + 1
+        reached_nodes = []
         for node_id in reached_attack_steps:
-            node = self.nodes[node_id]
+            node = self.nodes.get(node_id)
             if node:
-                attacker.compromise(node)
+                reached_nodes.append(node)
             else:
                 msg = ("Could not find node with id %d"
                        "in reached attack steps.")
                 logger.error(msg, node_id)
                 raise AttackGraphException(msg % node_id)
+
+        attacker.compromise_many(reached_nodes)
         for node_id in entry_points:
-            node = self.nodes[node_id]
+            node = self.nodes.get(node_id)
             if node:
                 attacker.entry_points.add(node)
             else:
@@ -800,18 +886,14 @@ class AttackGraph():
         Arguments:
         attacker    - the attacker we wish to remove from the attack graph
         """
-        if logger.isEnabledFor(logging.DEBUG):
-            # Avoid running json.dumps when not in debug
-            logger.debug(
-                'Remove attacker "%s" with id:%d.',
-                attacker.name, attacker.id
-            )
-
-        # Copy set - we can not remove elements from a set we are looping over
-        nodes_to_uncompromise = set(attacker.reached_attack_steps)
-        for node in nodes_to_uncompromise:
-            attacker.undo_compromise(node)
+        logger.debug(
+            'Remove attacker "%s" with id:%d.',
+            attacker.name, attacker.id
+        )
 
         if not isinstance(attacker.id, int):
             raise ValueError(f'Invalid attacker id: {attacker.id}')
+
+        attacker.undo_all_compromises()
+
         del self.attackers[attacker.id]
@@ -64,13 +64,13 @@ class AttackGraphNode:
         if self.model_asset is not None:
             node_dict['asset'] = str(self.model_asset.name)
         if self.defense_status is not None:
-            node_dict['defense_status'] = str(self.defense_status)
+            node_dict['defense_status'] = self.defense_status
         if self.existence_status is not None:
-            node_dict['existence_status'] = str(self.existence_status)
+            node_dict['existence_status'] = self.existence_status
         if self.is_viable is not None:
-            node_dict['is_viable'] = str(self.is_viable)
+            node_dict['is_viable'] = self.is_viable
         if self.is_necessary is not None:
-            node_dict['is_necessary'] = str(self.is_necessary)
+            node_dict['is_necessary'] = self.is_necessary
         if self.tags:
             node_dict['tags'] = list(self.tags)
         if self.extras:
@@ -104,9 +104,14 @@ class AttackGraphNode:
             lg_attack_step = self.lg_attack_step
         )
 
-        copied_node.tags = copy.deepcopy(self.tags, memo)
+        # Tags and ttc start out shared with the language graph attack step,
+        # just like in the original node, and are only copied if they were
+        # replaced on this node.
+        if self.tags is not self.lg_attack_step.tags:
+            copied_node.tags = copy.deepcopy(self.tags, memo)
+        if self.ttc is not self.lg_attack_step.ttc:
+            copied_node.ttc = copy.deepcopy(self.ttc, memo)
         copied_node.extras = copy.deepcopy(self.extras, memo)
-        copied_node.ttc = copy.deepcopy(self.ttc, memo)
 
         copied_node.defense_status = self.defense_status
         copied_node.existence_status = self.existence_status
@@ -182,12 +187,15 @@ class AttackGraphNode:
             self.defense_status != 1.0
 
 
-    @property
+    @cached_property
     def full_name(self) -> str:
         """
         Return the full name of the attack step. This is a combination of the
         asset name to which the attack step belongs and attack step name
         itself.
+
+        The name is computed once, it is also the key the node is indexed
+        under in its attack graph.
         """
         if self.model_asset:
             full_name = self.model_asset.name + ':' + self.name
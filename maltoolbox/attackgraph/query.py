@@ -155,10 +155,13 @@ def calculate_attack_surface(
             attacker.id
         )
         for child in attack_step.children:
+            if child in attack_surface:
+                # Children shared by several frontier nodes only need to be
+                # evaluated once
+                continue
             if skip_compromised and child.is_compromised_by(attacker):
                 continue
-            if is_node_traversable_by_attacker(child, attacker) and \
-                    child not in attack_surface:
+            if is_node_traversable_by_attacker(child, attacker):
                 logger.debug(
                     'Add node "%s"(%d) to the attack surface of '
                     'Attacker "%s"(%d).',
@@ -1,8 +1,28 @@
 """Utily functions for file handling"""
 
 import json
+from collections.abc import Callable, Iterable
+from typing import Any, Optional
+
 import yaml
 
+# orjson is optional, it is only used to parse json faster when present
+_orjson_loads: Optional[Callable[[str | bytes], Any]]
+try:
+    import orjson
+    _orjson_loads = orjson.loads
+except ImportError:
+    _orjson_loads = None
+
+# The libyaml based loader is much faster, but PyYAML can be built without it
+YamlSafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+class NoAliasSafeDumper(yaml.SafeDumper):
+    """Safe yaml dumper that writes repeated objects out in full"""
+    def ignore_aliases(self, data):
+        return True
+
 def save_dict_to_json_file(filename: str, serialized_object: dict) -> None:
     """Save serialized object to a json file.
 
@@ -15,6 +35,42 @@ def save_dict_to_json_file(filename: str, serialized_object: dict) -> None:
         json.dump(serialized_object, f, indent=4)
 
 
+def save_dict_items_to_json_file(
+        filename: str,
+        sections: dict[str, Iterable[tuple[str, Any]]]
+    ) -> None:
+    """Save serialized items to a json file one item at a time.
+
+    The output is the same as that of save_dict_to_json_file for the
+    equivalent dict of dicts, but that dict is never built in memory.
+
+    Arguments:
+    filename        - the name of the output file
+    sections        - dict mapping each top level key to an iterable of
+                      (key, value) pairs that make up its contents
+    """
+
+    indent = ' ' * 8
+    # One encoder for every item, json.dumps would set up a new one per call
+    encode = json.JSONEncoder(indent=4).encode
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.write('{')
+        for section_index, (section, items) in enumerate(sections.items()):
+            if section_index:
+                f.write(',')
+            f.write('\n    ' + json.dumps(section) + ': {')
+            empty = True
+            for key, value in items:
+                f.write('\n' if empty else ',\n')
+                # Strings in json never contain raw newlines, so the nested
+                # value can be indented by rewriting its line breaks.
+                f.write(indent + json.dumps(str(key)) + ': ' +
+                    encode(value).replace('\n', '\n' + indent))
+                empty = False
+            f.write('}' if empty else '\n    }')
+        f.write('\n}' if sections else '}')
+
+
 def save_dict_to_yaml_file(filename: str, serialized_object: dict) -> None:
     """Save serialized object to a yaml file.
 
@@ -23,25 +79,40 @@ def save_dict_to_yaml_file(filename: str, serialized_object: dict) -> None:
     data            - dict to output as yaml
     """
 
-    class NoAliasSafeDumper(yaml.SafeDumper):
-        def ignore_aliases(self, data):
-            return True
-
     with open(filename, 'w', encoding='utf-8') as f:
         yaml.dump(serialized_object, f, Dumper=NoAliasSafeDumper)
 
 
 def load_dict_from_yaml_file(filename: str) -> dict:
-    """Open json file and read as dict"""
+    """Open yaml file and read as dict"""
     with open(filename, 'r', encoding='utf-8') as file:
-        object_dict = yaml.safe_load(file)
+        object_dict = yaml.load(file, Loader=YamlSafeLoader)
     return object_dict
 
 
+def load_dict_from_json_string(json_string: str | bytes) -> dict:
+    """Parse a json document into a dict.
+
+    orjson is used if it is installed. Documents it rejects, like ones with
+    the NaN and Infinity values json.dump writes for non-finite floats, are
+    parsed with the json module instead.
+
+    Arguments:
+    json_string     - the json document as str or utf-8 encoded bytes
+    """
+    if _orjson_loads is not None:
+        try:
+            return _orjson_loads(json_string)
+        except json.JSONDecodeError:
+            # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+            pass
+    return json.loads(json_string)
+
+
 def load_dict_from_json_file(filename: str) -> dict:
-    """Open yaml file and read as dict"""
-    with open(filename, 'r', encoding='utf-8') as file:
-        object_dict = json.loads(file.read())
+    """Open json file and read as dict"""
+    with open(filename, 'rb') as file:
+        object_dict = load_dict_from_json_string(file.read())
     return object_dict
 
 
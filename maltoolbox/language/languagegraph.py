@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import logging
 import json
+import sys
 import zipfile
 
 from dataclasses import dataclass, field
@@ -14,7 +15,7 @@ from typing import Any, Optional
 
 from maltoolbox.file_utils import (
     load_dict_from_yaml_file, load_dict_from_json_file,
-    save_dict_to_file
+    load_dict_from_json_string, save_dict_to_file
 )
 from .compiler import MalCompiler
 from ..exceptions import (
@@ -32,7 +33,7 @@ def disaggregate_attack_step_full_name(
     return attack_step_full_name.split(':')
 
 
-@dataclass
+@dataclass(slots=True)
 class Detector:
     name: Optional[str]
     context: Context
@@ -78,6 +79,11 @@ class LanguageGraphAsset:
     is_abstract: Optional[bool] = None
 
 
+    def __post_init__(self):
+        # Asset names are the keys of most language graph and model lookups
+        self.name = sys.intern(self.name)
+
+
     def to_dict(self) -> dict:
         """Convert LanguageGraphAsset to dictionary"""
         node_dict: dict[str, Any] = {
@@ -126,12 +132,16 @@ class LanguageGraphAsset:
         True if this asset extends the target_asset via inheritance.
         False otherwise.
         """
-        current_asset: Optional[LanguageGraphAsset] = self
-        while (current_asset):
-            if current_asset == target_asset:
-                return True
-            current_asset = current_asset.own_super_asset
-        return False
+        return target_asset.name in self._super_asset_names
+
+
+    @cached_property
+    def _super_asset_names(self) -> frozenset[str]:
+        """
+        Return the names of this asset and of all of the assets it extends,
+        so that checking inheritance does not walk the chain every time.
+        """
+        return frozenset(asset.name for asset in self.super_assets)
 
 
     @cached_property
@@ -239,7 +249,7 @@ class LanguageGraphAsset:
         return self_superassets.intersection(other_superassets)
 
 
-@dataclass
+@dataclass(slots=True)
 class LanguageGraphAssociationField:
     asset: LanguageGraphAsset
     fieldname: str
@@ -247,7 +257,7 @@ class LanguageGraphAssociationField:
     maximum: int
 
 
-@dataclass
+@dataclass(slots=True)
 class LanguageGraphAssociation:
     name: str
     left_field: LanguageGraphAssociationField
@@ -373,15 +383,20 @@ class LanguageGraphAttackStep:
     info: dict = field(default_factory = dict)
     inherits: Optional[LanguageGraphAttackStep] = None
     tags: set = field(default_factory = set)
-    _attributes: Optional[dict] = None
     detectors: dict = field(default_factory = lambda: {})
+    own_requires: Optional[list[ExpressionsChain]] = None
+
+
+    def __post_init__(self):
+        self.name = sys.intern(self.name)
+        self.type = sys.intern(self.type)
 
 
     def __hash__(self):
         return hash(self.full_name)
 
 
-    @property
+    @cached_property
     def full_name(self) -> str:
         """
         Return the full name of the attack step. This is a combination of the
@@ -425,7 +440,7 @@ class LanguageGraphAttackStep:
                 else:
                     node_dict['parents'][parent].append(None)
 
-        if hasattr(self, 'own_requires'):
+        if self.own_requires is not None:
             node_dict['requires'] = []
             for requirement in self.own_requires:
                 node_dict['requires'].append(requirement.to_dict())
@@ -435,7 +450,7 @@ class LanguageGraphAttackStep:
 
     @cached_property
     def requires(self):
-        if not hasattr(self, 'own_requires'):
+        if self.own_requires is None:
             requirements = []
         else:
             requirements = self.own_requires
@@ -446,7 +461,8 @@ class LanguageGraphAttackStep:
 
 
     def __repr__(self) -> str:
-        return str(self.to_dict())
+        return (f'LanguageGraphAttackStep(name: "{self.full_name}", '
+            f'type: {self.type})')
 
 
 class ExpressionsChain:
@@ -459,15 +475,33 @@ class ExpressionsChain:
             association = None,
             subtype = None
         ):
-        self.type = type
+        # Share a single string object per distinct type and field name
+        self.type = sys.intern(type)
         self.left_link: Optional[ExpressionsChain] = left_link
         self.right_link: Optional[ExpressionsChain] = right_link
         self.sub_link: Optional[ExpressionsChain] = sub_link
-        self.fieldname: Optional[str] = fieldname
+        self.fieldname: Optional[str] = \
+            sys.intern(fieldname) if fieldname else fieldname
         self.association: Optional[LanguageGraphAssociation] = association
         self.subtype: Optional[Any] = subtype
 
 
+    @cached_property
+    def is_distributive(self) -> bool:
+        """
+        Return True if following this expressions chain from a set of assets
+        gives the same targets as following it from each of the assets on
+        their own and merging the results. This holds for every chain that
+        does not contain an intersection or a difference.
+        """
+        if self.type in ('intersection', 'difference'):
+            return False
+        return all(
+            link.is_distributive for link in
+            (self.left_link, self.right_link, self.sub_link) if link
+        )
+
+
     def to_dict(self) -> dict:
         """Convert ExpressionsChain to dictionary"""
         match (self.type):
@@ -557,7 +591,9 @@ class ExpressionsChain:
             return None
 
         if 'type' not in serialized_expr_chain:
-            logger.debug(json.dumps(serialized_expr_chain, indent = 2))
+            if logger.isEnabledFor(logging.DEBUG):
+                # Avoid running json.dumps when not in debug
+                logger.debug(json.dumps(serialized_expr_chain, indent = 2))
             msg = 'Missing expressions chain type!'
             logger.error(msg)
             raise LanguageGraphAssociationError(msg)
@@ -654,6 +690,13 @@ class LanguageGraph():
     """Graph representation of a MAL language"""
     def __init__(self, lang: Optional[dict] = None):
         self.assets: dict = {}
+        # Per asset type caches of the language specification lookups
+        self._attacks_by_asset_type: dict[str, dict] = {}
+        self._var_exprs_by_asset_type: dict[str, dict] = {}
+        # The asset entries of the language specification by asset name and
+        # the association entries by the name of either of their assets
+        self._asset_dicts_by_name: dict[str, dict] = {}
+        self._assoc_dicts_by_asset_type: dict[str, list[dict]] = {}
         if lang is not None:
             self._lang_spec: dict = lang
             self.metadata = {
@@ -691,8 +734,9 @@ class LanguageGraph():
         """
         logger.info('Loading mar archive %s', mar_archive)
         with zipfile.ZipFile(mar_archive, 'r') as archive:
-            langspec = archive.read('langspec.json')
-            return LanguageGraph(json.loads(langspec))
+            langspec = load_dict_from_json_string(
+                archive.read('langspec.json'))
+        return LanguageGraph(langspec)
 
 
     def _to_dict(self):
@@ -1028,8 +1072,11 @@ class LanguageGraph():
                         step_expression['rhs']
                     )
 
-                if not lh_target_asset.get_all_common_superassets(
-                        rh_target_asset):
+                # Assets extend at most one other asset, so the two targets
+                # share a common superasset exactly when they share the top
+                # one. This avoids building the sets of all their ancestors.
+                if lh_target_asset.super_assets[-1] is not \
+                        rh_target_asset.super_assets[-1]:
                     logger.error(
                         "Set operation attempted between targets that"
                         " do not share any common superassets: %s and %s!",
@@ -1052,8 +1099,6 @@ class LanguageGraph():
                 var_name = step_expression['name']
                 var_target_asset, var_expr_chain = self._resolve_variable(
                     target_asset, var_name)
-                var_target_asset, var_expr_chain = \
-                    target_asset.get_variable(var_name)
                 if var_expr_chain is not None:
                     return (
                         var_target_asset,
@@ -1312,16 +1357,26 @@ class LanguageGraph():
         A tuple containing the target asset and expressions chain required to
         reach it.
         """
-        if var_name not in asset.variables:
-            var_expr = self._get_var_expr_for_asset(asset.name, var_name)
+        # Variables are resolved once and memoized on the asset that defines
+        # them, so every later reference to them from that asset or any of
+        # its sub assets is a lookup up the inheritance chain.
+        variable = asset.get_variable(var_name)
+        if variable is None:
+            defining_asset = asset
+            while var_name not in self._get_var_exprs_for_asset_type(
+                    defining_asset.name) and defining_asset.own_super_asset:
+                defining_asset = defining_asset.own_super_asset
+
+            var_expr = self._get_var_expr_for_asset(
+                defining_asset.name, var_name)
             target_asset, expr_chain, _ = self.process_step_expression(
-                asset,
+                defining_asset,
                 None,
                 var_expr
             )
-            asset.own_variables[var_name] = (target_asset, expr_chain)
-            return (target_asset, expr_chain)
-        return asset.variables[var_name]
+            variable = (target_asset, expr_chain)
+            defining_asset.own_variables[var_name] = variable
+        return variable
 
 
     def _generate_graph(self) -> None:
@@ -1329,6 +1384,18 @@ class LanguageGraph():
         Generate language graph starting from the MAL language specification
         given in the constructor.
         """
+        self._asset_dicts_by_name = {
+            asset_dict['name']: asset_dict
+            for asset_dict in self._lang_spec['assets']
+        }
+        self._assoc_dicts_by_asset_type = {}
+        for assoc_dict in self._lang_spec['associations']:
+            self._assoc_dicts_by_asset_type.setdefault(
+                assoc_dict['leftAsset'], []).append(assoc_dict)
+            if assoc_dict['rightAsset'] != assoc_dict['leftAsset']:
+                self._assoc_dicts_by_asset_type.setdefault(
+                    assoc_dict['rightAsset'], []).append(assoc_dict)
+
         # Generate all of the asset nodes of the language graph.
         for asset_dict in self._lang_spec['assets']:
             logger.debug(
@@ -1420,6 +1487,11 @@ class LanguageGraph():
 
 
         # Generate all of the attack step nodes of the language graph.
+        # The language specification of each attack step is only needed
+        # until its children are linked below, so it is kept aside here
+        # rather than stored on the attack step nodes.
+        attack_steps_to_link: list[
+            tuple[LanguageGraphAttackStep, dict]] = []
         for asset in self.assets.values():
             logger.debug(
                 'Create attack steps language graph nodes for asset %s',
@@ -1444,7 +1516,8 @@ class LanguageGraph():
                     info = attack_step_attribs['meta'],
                     tags = set(attack_step_attribs['tags'])
                 )
-                attack_step_node._attributes = attack_step_attribs
+                attack_steps_to_link.append(
+                    (attack_step_node, attack_step_attribs))
                 asset.attack_steps[attack_step_attribs['name']] = \
                     attack_step_node
 
@@ -1462,140 +1535,132 @@ class LanguageGraph():
                         tprate=detector.get("tprate"),
                     )
 
-        # Create the inherited attack steps
-        assets = list(self.assets.values())
-        while len(assets) > 0:
-            asset = assets.pop(0)
-            if asset.own_super_asset in assets:
-                # The asset still has super assets that should be resolved
-                # first, moved it to the back.
-                assets.append(asset)
-            else:
-                if asset.own_super_asset:
-                    for attack_step in \
-                            asset.own_super_asset.attack_steps.values():
-                        if attack_step.name not in asset.attack_steps:
-                            attack_step_node = LanguageGraphAttackStep(
-                                name = attack_step.name,
-                                type = attack_step.type,
-                                asset = asset,
-                                ttc = attack_step.ttc,
-                                overrides = False,
-                                children = {},
-                                parents = {},
-                                info = attack_step.info,
-                                tags = set(attack_step.tags)
-                            )
-                            attack_step_node.inherits = attack_step
-                            asset.attack_steps[attack_step.name] = attack_step_node
-                        elif asset.attack_steps[attack_step.name].overrides:
-                            # The inherited attack step was already overridden.
-                            continue
-                        else:
-                            asset.attack_steps[attack_step.name].inherits = \
-                                attack_step
-                            asset.attack_steps[attack_step.name].tags |= \
-                                attack_step.tags
-                            asset.attack_steps[attack_step.name].info |= \
-                                attack_step.info
+        # Create the inherited attack steps. Assets are visited by depth in
+        # the inheritance hierarchy, so the attack steps of a super asset,
+        # inherited ones included, are complete before its sub assets are.
+        for asset in sorted(self.assets.values(),
+                key = lambda asset: len(asset.super_assets)):
+            if asset.own_super_asset:
+                for attack_step in \
+                        asset.own_super_asset.attack_steps.values():
+                    if attack_step.name not in asset.attack_steps:
+                        attack_step_node = LanguageGraphAttackStep(
+                            name = attack_step.name,
+                            type = attack_step.type,
+                            asset = asset,
+                            ttc = attack_step.ttc,
+                            overrides = False,
+                            children = {},
+                            parents = {},
+                            info = attack_step.info,
+                            tags = set(attack_step.tags)
+                        )
+                        attack_step_node.inherits = attack_step
+                        asset.attack_steps[attack_step.name] = attack_step_node
+                    elif asset.attack_steps[attack_step.name].overrides:
+                        # The inherited attack step was already overridden.
+                        continue
+                    else:
+                        asset.attack_steps[attack_step.name].inherits = \
+                            attack_step
+                        asset.attack_steps[attack_step.name].tags |= \
+                            attack_step.tags
+                        asset.attack_steps[attack_step.name].info |= \
+                            attack_step.info
 
         # Then, link all of the attack step nodes according to their
-        # associations.
-        for asset in self.assets.values():
-            for attack_step in asset.attack_steps.values():
-                logger.debug(
-                    'Determining children for attack step %s',
-                    attack_step.name
-                )
+        # associations. Inherited attack steps that were not overridden have
+        # no specification of their own and nothing to link.
+        for attack_step, attack_step_attribs in attack_steps_to_link:
+            logger.debug(
+                'Determining children for attack step %s',
+                attack_step.name
+            )
 
-                if attack_step._attributes is None:
-                    # This is simply an empty inherited attack step
-                    continue
+            step_expressions = \
+                attack_step_attribs['reaches']['stepExpressions'] if \
+                    attack_step_attribs['reaches'] else []
 
+            for step_expression in step_expressions:
+                # Resolve each of the attack step expressions listed for
+                # this attack step to determine children.
+                (target_asset, expr_chain, target_attack_step_name) = \
+                    self.process_step_expression(
+                        attack_step.asset,
+                        None,
+                        step_expression
+                    )
+                if not target_asset:
+                    msg = 'Failed to find target asset to link with for ' \
+                        'step expression:\n%s'
+                    raise LanguageGraphStepExpressionError(
+                        msg % json.dumps(step_expression, indent = 2)
+                    )
+
+                target_asset_attack_steps = target_asset.attack_steps
+                if target_attack_step_name not in \
+                        target_asset_attack_steps:
+                    msg = 'Failed to find target attack step %s on %s to ' \
+                          'link with for step expression:\n%s'
+                    raise LanguageGraphStepExpressionError(
+                        msg % (
+                            target_attack_step_name,
+                            target_asset.name,
+                            json.dumps(step_expression, indent = 2)
+                        )
+                    )
+
+                target_attack_step = target_asset_attack_steps[
+                    target_attack_step_name]
+
+                # Link to the children target attack steps
+                if target_attack_step.full_name in attack_step.children:
+                    attack_step.children[target_attack_step.full_name].\
+                        append((target_attack_step, expr_chain))
+                else:
+                    attack_step.children[target_attack_step.full_name] = \
+                        [(target_attack_step, expr_chain)]
+                # Reverse the children associations chains to get the
+                # parents associations chain.
+                if attack_step.full_name in target_attack_step.parents:
+                    target_attack_step.parents[attack_step.full_name].\
+                        append((attack_step,
+                        self.reverse_expr_chain(expr_chain,
+                            None)))
+                else:
+                    target_attack_step.parents[attack_step.full_name] = \
+                        [(attack_step,
+                        self.reverse_expr_chain(expr_chain,
+                            None))]
+
+            # Evaluate the requirements of exist and notExist attack steps
+            if attack_step.type == 'exist' or \
+                    attack_step.type == 'notExist':
                 step_expressions = \
-                    attack_step._attributes['reaches']['stepExpressions'] if \
-                        attack_step._attributes['reaches'] else []
+                    attack_step_attribs['requires']['stepExpressions'] \
+                        if attack_step_attribs['requires'] else []
+                if not step_expressions:
+                    msg = 'Failed to find requirements for attack step' \
+                    ' "%s" of type "%s":\n%s'
+                    raise LanguageGraphStepExpressionError(
+                        msg % (
+                            attack_step.name,
+                            attack_step.type,
+                            json.dumps(attack_step_attribs, indent = 2)
+                        )
+                    )
 
+                attack_step.own_requires = []
                 for step_expression in step_expressions:
-                    # Resolve each of the attack step expressions listed for
-                    # this attack step to determine children.
-                    (target_asset, expr_chain, target_attack_step_name) = \
+                    _, \
+                    result_expr_chain, \
+                    _ = \
                         self.process_step_expression(
                             attack_step.asset,
                             None,
                             step_expression
                         )
-                    if not target_asset:
-                        msg = 'Failed to find target asset to link with for ' \
-                            'step expression:\n%s'
-                        raise LanguageGraphStepExpressionError(
-                            msg % json.dumps(step_expression, indent = 2)
-                        )
-
-                    target_asset_attack_steps = target_asset.attack_steps
-                    if target_attack_step_name not in \
-                            target_asset_attack_steps:
-                        msg = 'Failed to find target attack step %s on %s to ' \
-                              'link with for step expression:\n%s'
-                        raise LanguageGraphStepExpressionError(
-                            msg % (
-                                target_attack_step_name,
-                                target_asset.name,
-                                json.dumps(step_expression, indent = 2)
-                            )
-                        )
-
-                    target_attack_step = target_asset_attack_steps[
-                        target_attack_step_name]
-
-                    # Link to the children target attack steps
-                    if target_attack_step.full_name in attack_step.children:
-                        attack_step.children[target_attack_step.full_name].\
-                            append((target_attack_step, expr_chain))
-                    else:
-                        attack_step.children[target_attack_step.full_name] = \
-                            [(target_attack_step, expr_chain)]
-                    # Reverse the children associations chains to get the
-                    # parents associations chain.
-                    if attack_step.full_name in target_attack_step.parents:
-                        target_attack_step.parents[attack_step.full_name].\
-                            append((attack_step,
-                            self.reverse_expr_chain(expr_chain,
-                                None)))
-                    else:
-                        target_attack_step.parents[attack_step.full_name] = \
-                            [(attack_step,
-                            self.reverse_expr_chain(expr_chain,
-                                None))]
-
-                # Evaluate the requirements of exist and notExist attack steps
-                if attack_step.type == 'exist' or \
-                        attack_step.type == 'notExist':
-                    step_expressions = \
-                        attack_step._attributes['requires']['stepExpressions'] \
-                            if attack_step._attributes['requires'] else []
-                    if not step_expressions:
-                        msg = 'Failed to find requirements for attack step' \
-                        ' "%s" of type "%s":\n%s'
-                        raise LanguageGraphStepExpressionError(
-                            msg % (
-                                attack_step.name,
-                                attack_step.type,
-                                json.dumps(attack_step._attributes, indent = 2)
-                            )
-                        )
-
-                    attack_step.own_requires = []
-                    for step_expression in step_expressions:
-                        _, \
-                        result_expr_chain, \
-                        _ = \
-                            self.process_step_expression(
-                                attack_step.asset,
-                                None,
-                                step_expression
-                            )
-                        attack_step.own_requires.append(result_expr_chain)
+                    attack_step.own_requires.append(result_expr_chain)
 
     def _get_attacks_for_asset_type(self, asset_type: str) -> dict:
         """
@@ -1612,13 +1677,12 @@ class LanguageGraph():
         attack such as type of attack, TTC distribution, child attack steps
         and other information
         """
+        if asset_type in self._attacks_by_asset_type:
+            return self._attacks_by_asset_type[asset_type]
+
         attack_steps: dict = {}
-        try:
-            asset = next(
-                asset for asset in self._lang_spec['assets'] \
-                    if asset['name'] == asset_type
-            )
-        except StopIteration:
+        asset = self._asset_dicts_by_name.get(asset_type)
+        if asset is None:
             logger.error(
                 'Failed to find asset type %s when looking'
                 'for attack steps.', asset_type
@@ -1631,6 +1695,7 @@ class LanguageGraph():
         )
 
         attack_steps = {step['name']: step for step in asset['attackSteps']}
+        self._attacks_by_asset_type[asset_type] = attack_steps
 
         return attack_steps
 
@@ -1655,8 +1720,7 @@ class LanguageGraph():
         )
         associations: list = []
 
-        asset = next((asset for asset in self._lang_spec['assets'] \
-            if asset['name'] == asset_type), None)
+        asset = self._asset_dicts_by_name.get(asset_type)
         if not asset:
             logger.error(
                 'Failed to find asset type %s when '
@@ -1664,14 +1728,8 @@ class LanguageGraph():
             )
             return associations
 
-        assoc_iter = (assoc for assoc in self._lang_spec['associations'] \
-            if assoc['leftAsset'] == asset_type or \
-                assoc['rightAsset'] == asset_type)
-        assoc = next(assoc_iter, None)
-        while (assoc):
-            associations.append(assoc)
-            assoc = next(assoc_iter, None)
-
+        associations.extend(
+            self._assoc_dicts_by_asset_type.get(asset_type, ()))
         return associations
 
     def _get_variables_for_asset_type(
@@ -1689,8 +1747,7 @@ class LanguageGraph():
             belonging to the asset.
         """
 
-        asset_dict = next((asset for asset in self._lang_spec['assets'] \
-            if asset['name'] == asset_type), None)
+        asset_dict = self._asset_dicts_by_name.get(asset_type)
         if not asset_dict:
             msg = 'Failed to find asset type %s in language specification '\
                 'when looking for variables.'
@@ -1699,6 +1756,28 @@ class LanguageGraph():
 
         return asset_dict['variables']
 
+    def _get_var_exprs_for_asset_type(self, asset_type: str) -> dict:
+        """
+        Get the step expressions of the variables of a specific asset type
+        by variable name. Only the variables defined by the asset type itself
+        are included, not the inherited ones.
+
+        Arguments:
+        asset_type      - a string representing the type of asset which
+                          contains the variables
+
+        Return:
+        A dictionary mapping variable names to their step expressions.
+        """
+
+        var_exprs = self._var_exprs_by_asset_type.get(asset_type)
+        if var_exprs is None:
+            var_exprs = self._var_exprs_by_asset_type[asset_type] = {
+                var_entry['name']: var_entry['stepExpression']
+                for var_entry in self._get_variables_for_asset_type(asset_type)
+            }
+        return var_exprs
+
     def _get_var_expr_for_asset(
             self, asset_type: str, var_name) -> dict:
         """
@@ -1713,10 +1792,7 @@ class LanguageGraph():
         A dictionary representing the step expression for the variable.
         """
 
-        vars_dict = self._get_variables_for_asset_type(asset_type)
-
-        var_expr = next((var_entry['stepExpression'] for var_entry \
-            in vars_dict if var_entry['name'] == var_name), None)
+        var_expr = self._get_var_exprs_for_asset_type(asset_type).get(var_name)
 
         if not var_expr:
             msg = 'Failed to find variable name "%s" in language '\
@@ -1732,6 +1808,8 @@ class LanguageGraph():
         """
 
         self.assets = {}
+        self._attacks_by_asset_type = {}
+        self._var_exprs_by_asset_type = {}
         self._generate_graph()
 
 
@@ -71,8 +71,8 @@ class AttackerAttachment:
         """
 
         logger.debug(
-            f'Add entry point "{attackstep_name}" on asset "{asset.name}" '
-            f'to AttackerAttachment "{self.name}".'
+            'Add entry point "%s" on asset "%s" to AttackerAttachment "%s".',
+            attackstep_name, asset.name, self.name
         )
 
         # Get the entry point tuple for the asset if it already exists
@@ -85,8 +85,9 @@ class AttackerAttachment:
                 entry_point_tuple[1].append(attackstep_name)
             else:
                 logger.info(
-                    f'Entry point "{attackstep_name}" on asset "{asset.name}"'
-                    f' already existed for AttackerAttachment "{self.name}".'
+                    'Entry point "%s" on asset "%s" already existed for '
+                    'AttackerAttachment "%s".',
+                    attackstep_name, asset.name, self.name
                 )
         else:
             # Otherwise, create the entry point tuple and the initial entry
@@ -103,8 +104,9 @@ class AttackerAttachment:
         """
 
         logger.debug(
-            f'Remove entry point "{attackstep_name}" on asset "{asset.name}" '
-            f'from AttackerAttachment "{self.name}".'
+            'Remove entry point "%s" on asset "%s" from AttackerAttachment '
+            '"%s".',
+            attackstep_name, asset.name, self.name
         )
 
         # Get the entry point tuple for the asset if it exists
@@ -116,17 +118,18 @@ class AttackerAttachment:
                 entry_point_tuple[1].remove(attackstep_name)
             else:
                 logger.warning(
-                    f'Failed to find entry point "{attackstep_name}" on '
-                    f'asset "{asset.name}" for AttackerAttachment '
-                    f'"{self.name}". Nothing to remove.'
+                    'Failed to find entry point "%s" on asset "%s" for '
+                    'AttackerAttachment "%s". Nothing to remove.',
+                    attackstep_name, asset.name, self.name
                 )
 
             if not entry_point_tuple[1]:
                 self.entry_points.remove(entry_point_tuple)
         else:
             logger.warning(
-                f'Failed to find entry points on asset "{asset.name}" '
-                f'for AttackerAttachment "{self.name}". Nothing to remove.'
+                'Failed to find entry points on asset "%s" for '
+                'AttackerAttachment "%s". Nothing to remove.',
+                asset.name, self.name
             )
 
 
@@ -296,10 +299,6 @@ class Model():
         Return:
         An asset matching the id if it exists in the model.
         """
-        logger.debug(
-            'Get asset with id %d from model "%s".',
-            asset_id, self.name
-        )
         return self.assets.get(asset_id, None)
 
 
@@ -315,10 +314,6 @@ class Model():
         Return:
         An asset matching the name if it exists in the model.
         """
-        logger.debug(
-            'Get asset with name "%s" from model "%s".',
-            asset_name, self.name
-        )
         return self._name_to_asset.get(asset_name, None)
 
 
@@ -421,10 +416,13 @@ class Model():
             lang_graph,
             mt_version = maltoolbox_version)
 
-        # Reconstruct the assets
+        # Reconstruct the assets, keeping each next to its serialized
+        # associations so the ids are only converted once
+        assets_and_dicts: list[tuple[ModelAsset, dict]] = []
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         for asset_id, asset_dict in serialized_object['assets'].items():
 
-            if logger.isEnabledFor(logging.DEBUG):
+            if debug_enabled:
                 # Avoid running json.dumps when not in debug
                 logger.debug(
                     "Loading asset:\n%s", json.dumps(asset_dict, indent=2)
@@ -440,23 +438,26 @@ class Model():
                 }
             )
 
-            model.add_asset(
+            asset = model.add_asset(
                 asset_type = asset_dict['type'],
                 name = asset_dict['name'],
                 defenses = {defense: float(value) for defense, value in \
-                    asset_dict.get('defenses', {}).items()},
+                    (asset_dict.get('defenses') or {}).items()},
                 extras = asset_dict.get('extras', {}),
                 asset_id = int(asset_id))
+            assets_and_dicts.append((asset, asset_dict))
 
-        # Reconstruct the association links
-        for asset_id, asset_dict in serialized_object['assets'].items():
-            asset = model.assets[int(asset_id)]
-            assoc_assets_dict = asset_dict['associated_assets'].items()
+        # Reconstruct the association links. Every link is listed under both
+        # of its assets and adding it from the first one links both ways, so
+        # only the assets not linked yet are validated and added.
+        for asset, asset_dict in assets_and_dicts:
+            assoc_assets_dict = asset_dict.get('associated_assets', {}).items()
             for fieldname, assoc_assets in assoc_assets_dict:
                 asset.add_associated_assets(
                     fieldname,
                     {model.assets[int(assoc_asset_id)]
                         for assoc_asset_id in assoc_assets}
+                    - asset.associated_assets.get(fieldname, set())
                 )
 
         # Reconstruct the attackers
@@ -526,6 +527,8 @@ class ModelAsset:
         self.defenses: dict[str, float] = defenses or {}
         self.extras: dict = extras or {}
         self._associated_assets: dict[str, set[ModelAsset]] = {}
+        # Set by the attack graph built from this model, replaced as a whole
+        # every time a graph is generated or loaded for it.
         self.attack_step_nodes: list = []
 
         for step in self.lg_asset.attack_steps.values():
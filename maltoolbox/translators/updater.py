@@ -1,9 +1,5 @@
-import json
 import logging
 
-import yaml
-
-import logging
 from ..model import Model
 from ..language import LanguageGraph
 from ..file_utils import load_dict_from_json_file, load_dict_from_yaml_file
@@ -28,23 +24,22 @@ def load_model_from_older_version(
         'metadata', {}
     ).get('MAL-Toolbox Version', '0.0.')
 
-    match (version):
-        case x if '0.0.' in x:
-            model_dict = convert_model_dict_from_version_0_0(model_dict)
-            model_dict = convert_model_dict_from_version_0_1(model_dict)
-            model_dict = convert_model_dict_from_version_0_2(model_dict)
-        case x if '0.1.' in x:
-            model_dict = convert_model_dict_from_version_0_1(model_dict)
-            model_dict = convert_model_dict_from_version_0_2(model_dict)
-        case x if '0.2.' in x:
-            model_dict = convert_model_dict_from_version_0_2(model_dict)
-        case _:
-            msg = (
-                'Unknown version "%s" format.'
-                'Could not load model from file "%s"'
-            )
-            logger.error(msg, version, filename)
-            raise ValueError(msg % (version, filename))
+    # Only the major and minor version determine the model format
+    format_version = '.'.join(version.split('.', 2)[:2])
+    if format_version not in _MODEL_DICT_CONVERTERS:
+        msg = (
+            'Unknown version "%s" format.'
+            'Could not load model from file "%s"'
+        )
+        logger.error(msg, version, filename)
+        raise ValueError(msg % (version, filename))
+
+    # Bring the model up to date one format version at a time
+    converting = False
+    for converter_version, converter in _MODEL_DICT_CONVERTERS.items():
+        converting = converting or converter_version == format_version
+        if converting:
+            model_dict = converter(model_dict)
 
     # TODO: _from_dict should be public
     return Model._from_dict(model_dict, lang_graph)
@@ -144,53 +139,46 @@ def convert_model_dict_from_version_0_1(model_dict: dict) -> dict:
     # Meta data and assets format did not change from version 0.1
     new_model_dict['metadata'] = model_dict['metadata']
 
-    new_assets_dict = {}
-    for asset_id, asset_info in model_dict['assets'].items():
-        # Make sure asset ids are ints for json compatibility
-        asset_id = int(asset_id)
-        new_assets_dict[asset_id] = asset_info
+    # Make sure asset ids are ints for json compatibility
+    new_assets_dict = {
+        int(asset_id): asset_info
+        for asset_id, asset_info in model_dict['assets'].items()
+    }
 
     new_model_dict['assets'] = new_assets_dict
 
     # Reconstruct the associations dict in new format
     new_assoc_list = []
     for assoc_dict in model_dict.get('associations', []):
-        new_assoc_dict: dict[str, dict] = {}
-
-        assert len(assoc_dict.keys()) == 1, (
+        assert len(assoc_dict) == 1, (
             "Only one key per association in model file allowed"
         )
 
-        assoc_name = list(assoc_dict.keys())[0]
-        new_assoc_name = assoc_name.split("_")[0]
-        new_assoc_dict[new_assoc_name] = {}
-        for field, targets in assoc_dict[assoc_name].items():
-            new_assoc_dict[new_assoc_name][field] = targets
-
-        new_assoc_list.append(new_assoc_dict)
+        # Only the association name changed, the fields and their targets
+        # are reused as they are, like the asset dicts above
+        (assoc_name, assoc_fields), = assoc_dict.items()
+        new_assoc_list.append({assoc_name.split("_")[0]: assoc_fields})
 
     # Add new assoc dict to new model dict
     new_model_dict['associations'] = new_assoc_list
 
-    # Reconstruct attackers dict for new format
-    new_attackers_dict: dict[int, dict] = {}
+    # Reconstruct attackers dict for new format, entry points are now keyed
+    # by asset name
     attackers_dict: dict = model_dict.get('attackers', {})
-    for attacker_id, attacker_dict in attackers_dict.items():
-        attacker_id = int(attacker_id) # JSON compatibility
-        new_attackers_dict[attacker_id] = {}
-        new_attackers_dict[attacker_id]['name'] = attacker_dict['name']
-        new_entry_points_dict = {}
-
-        entry_points_dict = attacker_dict['entry_points']
-        for asset_id, attack_steps in entry_points_dict.items():
-                asset_id = int(asset_id) # JSON compatibility
-                asset_name = new_assets_dict[asset_id]['name']
-                new_entry_points_dict[asset_name] = {
-                    'asset_id': asset_id,
+    new_attackers_dict: dict[int, dict] = {
+        int(attacker_id): { # JSON compatibility
+            'name': attacker_dict['name'],
+            'entry_points': {
+                new_assets_dict[int(asset_id)]['name']: {
+                    'asset_id': int(asset_id), # JSON compatibility
                     'attack_steps': attack_steps['attack_steps']
                 }
-
-        new_attackers_dict[attacker_id]['entry_points'] = new_entry_points_dict
+                for asset_id, attack_steps in
+                    attacker_dict['entry_points'].items()
+            }
+        }
+        for attacker_id, attacker_dict in attackers_dict.items()
+    }
 
     # Add new attackers dict to new model dict
     new_model_dict['attackers'] = new_attackers_dict
@@ -226,30 +214,48 @@ def convert_model_dict_from_version_0_2(model_dict: dict) -> dict:
     # Reconstruct the associations dict in new format
     for assocs_dict in model_dict.get('associations', []):
 
-        assert len(assocs_dict.keys()) == 1, (
+        assert len(assocs_dict) == 1, (
             "Only one key per association in model file allowed"
         )
 
-        assoc_name = list(assocs_dict.keys())[0]
-        assoc_dict = assocs_dict[assoc_name]
-        left_field_name = list(assoc_dict.keys())[0]
-        right_field_name = list(assoc_dict.keys())[1]
+        assoc_dict, = assocs_dict.values()
+        left_field_name, right_field_name = list(assoc_dict)[:2]
+
+        # The right assets are paired with every left asset, so they are
+        # looked up once per association rather than once per pair
+        r_assets = []
+        for r_asset_id in assoc_dict[right_field_name]:
+            r_asset_id = int(r_asset_id)  # json compatibility
+            r_asset_dict = new_assets_dict[r_asset_id]
+            r_assets.append((r_asset_id, r_asset_dict, r_asset_dict['name']))
+
+        if not r_assets:
+            # There are no connections to add in either direction
+            continue
 
         for l_asset_id in assoc_dict[left_field_name]:
             l_asset_id = int(l_asset_id)  # json compatibility
-            for r_asset_id in assoc_dict[right_field_name]:
-                r_asset_id = int(r_asset_id)  # json compatibility
-                l_asset_dict = new_model_dict['assets'][l_asset_id]
-                r_asset_dict = new_model_dict['assets'][r_asset_id]
-
+            l_asset_dict = new_assets_dict[l_asset_id]
+            l_asset_name = l_asset_dict['name']
+            l_associated_assets = l_asset_dict['associated_assets'].setdefault(
+                right_field_name, {}
+            )
+            for r_asset_id, r_asset_dict, r_asset_name in r_assets:
                 # Add connections from left to right
-                l_asset_dict['associated_assets'].setdefault(
-                    right_field_name, {}
-                )[r_asset_id] = r_asset_dict['name']
+                l_associated_assets[r_asset_id] = r_asset_name
 
                 # And from right to left
                 r_asset_dict['associated_assets'].setdefault(
                     left_field_name, {}
-                )[l_asset_id] = l_asset_dict['name']
+                )[l_asset_id] = l_asset_name
 
     return new_model_dict
+
+
+# The converter from each older model format version to the next one, in
+# version order
+_MODEL_DICT_CONVERTERS = {
+    '0.0': convert_model_dict_from_version_0_0,
+    '0.1': convert_model_dict_from_version_0_1,
+    '0.2': convert_model_dict_from_version_0_2,
+}
@@ -75,3 +75,34 @@ def test_attacker_undo_compromise(dummy_lang_graph: LanguageGraph):
     # Make sure attacker/node  was removed
     assert attacker.reached_attack_steps == set()
     assert node1.compromised_by == set()
+
+def test_attacker_compromise_many_and_undo_all(dummy_lang_graph: LanguageGraph):
+    """Make sure bulk compromise and undo keep attacker and nodes in sync"""
+
+    dummy_or_attack_step = dummy_lang_graph.assets['DummyAsset'].\
+        attack_steps['DummyOrAttackStep']
+    attack_graph = AttackGraph(dummy_lang_graph)
+
+    node1 = attack_graph.add_node(
+        lg_attack_step = dummy_or_attack_step
+    )
+    node2 = attack_graph.add_node(
+        lg_attack_step = dummy_or_attack_step
+    )
+    attacker = Attacker("attacker1")
+    attack_graph.add_attacker(attacker)
+    reached_attack_steps = attacker.reached_attack_steps
+
+    attacker.compromise(node1)
+    # Already compromised nodes are not a problem
+    attacker.compromise_many([node1, node2])
+    assert attacker.reached_attack_steps == {node1, node2}
+    assert attacker.reached_attack_steps is reached_attack_steps
+    assert node1.compromised_by == {attacker}
+    assert node2.compromised_by == {attacker}
+
+    attacker.undo_all_compromises()
+    assert attacker.reached_attack_steps == set()
+    assert attacker.reached_attack_steps is reached_attack_steps
+    assert node1.compromised_by == set()
+    assert node2.compromised_by == set()
@@ -1,6 +1,9 @@
 """Unit tests for AttackGraph functionality"""
 
+from collections import Counter
 import copy
+from pathlib import Path
+import pytest
 from unittest.mock import patch
 
 from conftest import path_testdata
@@ -12,37 +15,40 @@ from maltoolbox.attackgraph import (
     Attacker,
     create_attack_graph
 )
+from maltoolbox.exceptions import AttackGraphException
 from maltoolbox.model import Model
 
 
-def test_attackgraph_init(corelang_lang_graph, model):
-    """Test init with different params given"""
-
+@pytest.mark.parametrize("model_given, expected_calls", [
     # _generate_graph is called when langspec and model is given to init
-    with patch("maltoolbox.attackgraph.AttackGraph._generate_graph")\
-         as _generate_graph:
-        AttackGraph(
-            lang_graph=corelang_lang_graph,
-            model=model
-        )
-        assert _generate_graph.call_count == 1
-
+    (True, 1),
     # _generate_graph is not called when no model is given
-    with patch("maltoolbox.attackgraph.AttackGraph._generate_graph")\
-        as _generate_graph:
-        AttackGraph(
-            lang_graph=corelang_lang_graph,
-            model=None
-        )
-        assert _generate_graph.call_count == 0
+    (False, 0),
+])
+@patch("maltoolbox.attackgraph.AttackGraph._generate_graph")
+def test_attackgraph_init(
+        _generate_graph,
+        corelang_lang_graph,
+        model,
+        model_given,
+        expected_calls
+    ):
+    """Test init with different params given"""
+
+    AttackGraph(
+        lang_graph=corelang_lang_graph,
+        model=model if model_given else None
+    )
+    assert _generate_graph.call_count == expected_calls
 
 def attackgraph_save_load_no_model_given(
         example_attackgraph: AttackGraph,
         corelang_lang_graph: LanguageGraph,
-        attach_attackers: bool
+        attach_attackers: bool,
+        tmp_path: Path
     ):
     """Save AttackGraph to a file and load it
-    Note: Will create file in /tmp"""
+    Note: Will create file in tmp_path"""
 
     reward = 1
     node_with_reward_before = example_attackgraph.nodes[0]
@@ -51,8 +57,8 @@ def attackgraph_save_load_no_model_given(
     if attach_attackers:
         example_attackgraph.attach_attackers()
 
-    # Save the example attack graph to /tmp
-    example_graph_path = "/tmp/example_graph.yml"
+    # Save the example attack graph to tmp_path
+    example_graph_path = str(tmp_path / "example_graph.yml")
     example_attackgraph.save_to_file(example_graph_path)
 
     # Load the attack graph
@@ -71,77 +77,127 @@ def attackgraph_save_load_no_model_given(
     # Both graphs should have the same nodes
     assert len(example_attackgraph.nodes) == len(loaded_attack_graph.nodes)
 
-    # Loaded graph nodes will not have 'asset' since it does not have a model.
-    for loaded_node in loaded_attack_graph.nodes.values():
-        if not isinstance(loaded_node.id, int):
-            raise ValueError(f'Invalid node id for loaded node.')
-        original_node = example_attackgraph.nodes[loaded_node.id]
-
-        assert original_node, \
-            f'Failed to find original node for id {loaded_node.id}.'
+    # Without a model the loaded nodes are named after their ids instead of
+    # their assets
+    no_model_full_names = {
+        node_id: str(node_id) + ":" + node.name
+        for node_id, node in example_attackgraph.nodes.items()
+    }
 
-        # Convert loaded and original node to dicts
-        loaded_node_dict = loaded_node.to_dict()
-        original_node_dict = original_node.to_dict()
-        for child in original_node_dict['children']:
-            child_node = example_attackgraph.nodes[child]
-            assert child_node, \
+    # Convert the original nodes to dicts once up front, as they are expected
+    # to look when loaded without a model
+    expected_node_dicts = {}
+    for node_id, node in example_attackgraph.nodes.items():
+        node_dict = node.to_dict()
+        for child in node_dict['children']:
+            assert child in no_model_full_names, \
                 f'Failed to find child node for id {child}.'
-            original_node_dict['children'][child] = str(child_node.id) + \
-                ":" + child_node.name
-        for parent in original_node_dict['parents']:
-            parent_node = example_attackgraph.nodes[parent]
-            assert parent_node, \
+            node_dict['children'][child] = no_model_full_names[child]
+        for parent in node_dict['parents']:
+            assert parent in no_model_full_names, \
                 f'Failed to find parent node for id {parent}.'
-            original_node_dict['parents'][parent] = str(parent_node.id) + \
-                ":" + parent_node.name
+            node_dict['parents'][parent] = no_model_full_names[parent]
 
         # Remove key that is not expected to match.
-        del original_node_dict['asset']
+        del node_dict['asset']
+        expected_node_dicts[node_id] = node_dict
+
+    # Loaded graph nodes will not have 'asset' since it does not have a model.
+    for loaded_node in loaded_attack_graph.nodes.values():
+        if not isinstance(loaded_node.id, int):
+            raise ValueError(f'Invalid node id for loaded node.')
+        assert loaded_node.id in expected_node_dicts, \
+            f'Failed to find original node for id {loaded_node.id}.'
 
         # Make sure nodes are the same (except for the excluded keys)
-        assert loaded_node_dict == original_node_dict
+        assert loaded_node.to_dict() == expected_node_dicts[loaded_node.id]
+
+    # The original attackers as they are expected to look when loaded
+    # without a model
+    expected_attacker_dicts = {}
+    for attacker_id, attacker in example_attackgraph.attackers.items():
+        attacker_dict = attacker.to_dict()
+        for step in attacker_dict['entry_points']:
+            attacker_dict['entry_points'][step] = no_model_full_names[step]
+        for step in attacker_dict['reached_attack_steps']:
+            attacker_dict['reached_attack_steps'][step] = \
+                no_model_full_names[step]
+        expected_attacker_dicts[attacker_id] = attacker_dict
 
     for loaded_attacker in loaded_attack_graph.attackers.values():
         if not isinstance(loaded_attacker.id, int):
             raise ValueError(f'Invalid attacker id for loaded attacker.')
-        original_attacker = example_attackgraph.attackers[loaded_attacker.id]
-        assert original_attacker, \
+        assert loaded_attacker.id in expected_attacker_dicts, \
             f'Failed to find original attacker for id {loaded_attacker.id}.'
-        loaded_attacker_dict = loaded_attacker.to_dict()
-        original_attacker_dict = original_attacker.to_dict()
-        for step in original_attacker_dict['entry_points']:
-            attack_step_name = original_attacker_dict['entry_points'][step]
-            attack_step_name = str(step) + ':' + \
-                attack_step_name.split(':')[-1]
-            original_attacker_dict['entry_points'][step] = attack_step_name
-        for step in original_attacker_dict['reached_attack_steps']:
-            attack_step_name = \
-                original_attacker_dict['reached_attack_steps'][step]
-            attack_step_name = str(step) + ':' + \
-                attack_step_name.split(':')[-1]
-            original_attacker_dict['reached_attack_steps'][step] = \
-                attack_step_name
-        assert loaded_attacker_dict == original_attacker_dict
+        assert loaded_attacker.to_dict() == \
+            expected_attacker_dicts[loaded_attacker.id]
 
 def test_attackgraph_save_load_no_model_given_without_attackers(
         example_attackgraph: AttackGraph,
-        corelang_lang_graph: LanguageGraph
+        corelang_lang_graph: LanguageGraph,
+        tmp_path: Path
     ):
     attackgraph_save_load_no_model_given(example_attackgraph,
-        corelang_lang_graph, False)
+        corelang_lang_graph, False, tmp_path)
 
 def test_attackgraph_save_load_no_model_given_with_attackers(
         example_attackgraph: AttackGraph,
-        corelang_lang_graph: LanguageGraph
+        corelang_lang_graph: LanguageGraph,
+        tmp_path: Path
     ):
     attackgraph_save_load_no_model_given(example_attackgraph,
-        corelang_lang_graph, True)
+        corelang_lang_graph, True, tmp_path)
+
 
-def attackgraph_save_and_load_json_yml_model_given(
+def test_attackgraph_from_dict_node_flags(
+        example_attackgraph: AttackGraph,
+        corelang_lang_graph: LanguageGraph
+    ):
+    """Node flags are loaded as native values, also from the string form
+    used by attack graphs saved by earlier versions"""
+
+    defense_node = next(node for node in example_attackgraph.nodes.values()
+                        if node.type == 'defense')
+    defense_node.defense_status = 1.0
+    defense_node.is_viable = False
+
+    serialized_graph = example_attackgraph._to_dict()
+    node_dict = serialized_graph['attack_steps'][defense_node.full_name]
+    assert node_dict['defense_status'] == 1.0
+    assert node_dict['is_viable'] is False
+
+    loaded_graph = AttackGraph._from_dict(
+        serialized_graph, corelang_lang_graph)
+    loaded_node = loaded_graph.nodes[defense_node.id]
+    assert loaded_node.defense_status == 1.0
+    assert loaded_node.is_viable is False
+    assert loaded_node.is_necessary is True
+    assert loaded_node.is_enabled_defense()
+
+    node_dict['defense_status'] = '1.0'
+    node_dict['is_viable'] = 'False'
+    node_dict['is_necessary'] = 'True'
+    loaded_graph = AttackGraph._from_dict(
+        serialized_graph, corelang_lang_graph)
+    loaded_node = loaded_graph.nodes[defense_node.id]
+    assert loaded_node.defense_status == 1.0
+    assert loaded_node.is_viable is False
+    assert loaded_node.is_necessary is True
+
+    # Any other value is reported instead of guessed
+    for invalid_value in ('true', None):
+        node_dict['is_viable'] = invalid_value
+        with pytest.raises(AttackGraphException, match='is_viable'):
+            AttackGraph._from_dict(serialized_graph, corelang_lang_graph)
+
+@pytest.mark.parametrize("attach_attackers", [False, True])
+@pytest.mark.parametrize("file_extension", ["yml", "json"])
+def test_attackgraph_save_and_load_json_yml_model_given(
         example_attackgraph: AttackGraph,
         corelang_lang_graph: LanguageGraph,
-        attach_attackers: bool
+        file_extension: str,
+        attach_attackers: bool,
+        tmp_path: Path
     ):
     """Try to save and load attack graph from json and yml with model given,
     and make sure the dict represenation is the same (except for reward field)
@@ -150,66 +206,46 @@ def attackgraph_save_and_load_json_yml_model_given(
     if attach_attackers:
         example_attackgraph.attach_attackers()
 
-    for attackgraph_path in ("/tmp/attackgraph.yml", "/tmp/attackgraph.json"):
-        example_attackgraph.save_to_file(attackgraph_path)
-        loaded_attackgraph = AttackGraph.load_from_file(
-            attackgraph_path,
-            corelang_lang_graph,
-            model=example_attackgraph.model
-        )
-
-        # Make sure model was 'attached' correctly
-        assert loaded_attackgraph.model == example_attackgraph.model
-
-        for node_full_name, loaded_node_dict in \
-                loaded_attackgraph._to_dict()['attack_steps'].items():
-            original_node_dict = \
-                example_attackgraph._to_dict()['attack_steps'][node_full_name]
-
-            # Make sure nodes are the same (except for the excluded keys)
-            assert loaded_node_dict == original_node_dict
-
-        for node in loaded_attackgraph.nodes.values():
-            # Make sure node gets an asset when loaded with model
-            assert node.model_asset
-            assert node.full_name == node.model_asset.name + ":" + node.name
-
-            # Make sure node was added to lookup dict with correct id / name
-            assert node.id is not None
-            assert loaded_attackgraph.nodes[node.id] == node
-            assert loaded_attackgraph.get_node_by_full_name(node.full_name) == node
-
-        for loaded_attacker in loaded_attackgraph.attackers.values():
-            if not isinstance(loaded_attacker.id, int):
-                raise ValueError(f'Invalid attacker id for loaded attacker.')
-            original_attacker = example_attackgraph.attackers[
-                loaded_attacker.id]
-            assert original_attacker, \
-                f'Failed to find original attacker for id ' \
-                '{loaded_attacker.id}.'
-            loaded_attacker_dict = loaded_attacker.to_dict()
-            original_attacker_dict = original_attacker.to_dict()
-            assert loaded_attacker_dict == original_attacker_dict
-
-def test_attackgraph_save_and_load_json_yml_model_given_without_attackers(
-        example_attackgraph: AttackGraph,
-        corelang_lang_graph: LanguageGraph
-    ):
-        attackgraph_save_and_load_json_yml_model_given(
-            example_attackgraph,
-            corelang_lang_graph,
-            False
-        )
+    attackgraph_path = str(tmp_path / f"attackgraph.{file_extension}")
+    example_attackgraph.save_to_file(attackgraph_path)
+    loaded_attackgraph = AttackGraph.load_from_file(
+        attackgraph_path,
+        corelang_lang_graph,
+        model=example_attackgraph.model
+    )
 
-def test_attackgraph_save_and_load_json_yml_model_given_with_attackers(
-        example_attackgraph: AttackGraph,
-        corelang_lang_graph: LanguageGraph
-    ):
-        attackgraph_save_and_load_json_yml_model_given(
-            example_attackgraph,
-            corelang_lang_graph,
-            True
-        )
+    # Make sure model was 'attached' correctly
+    assert loaded_attackgraph.model == example_attackgraph.model
+
+    original_node_dicts = example_attackgraph._to_dict()['attack_steps']
+    for node_full_name, loaded_node_dict in \
+            loaded_attackgraph._to_dict()['attack_steps'].items():
+        original_node_dict = original_node_dicts[node_full_name]
+
+        # Make sure nodes are the same (except for the excluded keys)
+        assert loaded_node_dict == original_node_dict
+
+    for node in loaded_attackgraph.nodes.values():
+        # Make sure node gets an asset when loaded with model
+        assert node.model_asset
+        assert node.full_name == node.model_asset.name + ":" + node.name
+
+        # Make sure node was added to lookup dict with correct id / name
+        assert node.id is not None
+        assert loaded_attackgraph.nodes[node.id] == node
+        assert loaded_attackgraph.get_node_by_full_name(node.full_name) == node
+
+    for loaded_attacker in loaded_attackgraph.attackers.values():
+        if not isinstance(loaded_attacker.id, int):
+            raise ValueError(f'Invalid attacker id for loaded attacker.')
+        original_attacker = example_attackgraph.attackers[
+            loaded_attacker.id]
+        assert original_attacker, \
+            f'Failed to find original attacker for id ' \
+            '{loaded_attacker.id}.'
+        loaded_attacker_dict = loaded_attacker.to_dict()
+        original_attacker_dict = original_attacker.to_dict()
+        assert loaded_attacker_dict == original_attacker_dict
 
 def test_attackgraph_attach_attackers(example_attackgraph: AttackGraph):
     """Make sure attackers are properly attached to graph"""
@@ -245,29 +281,31 @@ def test_attackgraph_attach_attackers(example_attackgraph: AttackGraph):
         # Make sure the Attacker is present on the nodes they have compromised
         assert attacker in node.compromised_by
 
-def test_attackgraph_generate_graph(example_attackgraph: AttackGraph):
+def test_attackgraph_generate_graph(corelang_lang_graph, model):
     """Make sure the graph is correctly generated from model and lang"""
     # TODO: Add test cases with defense steps
 
-    # Empty the attack graph
-    example_attackgraph.nodes = {}
-    example_attackgraph.attackers = {}
+    # Create 2 associated assets
+    app1 = model.add_asset(asset_type = 'Application')
+    app2 = model.add_asset(asset_type = 'Application')
+    app1.add_associated_assets(fieldname='appExecutedApps', assets = {app2})
 
-    # Generate the attack graph again
-    example_attackgraph._generate_graph()
+    # Generate a new attack graph for them
+    attack_graph = AttackGraph(lang_graph=corelang_lang_graph, model=model)
 
-    # Calculate how many nodes we should expect
+    # Calculate how many nodes we should expect, counting the attack steps
+    # of each asset type once
+    num_attack_steps_by_type: dict[str, int] = {}
     num_assets_attack_steps = 0
-    assert example_attackgraph.model
-    for asset in example_attackgraph.model.assets.values():
-        attack_steps = example_attackgraph.\
-            lang_graph._get_attacks_for_asset_type(
-                asset.type
+    for asset in model.assets.values():
+        if asset.type not in num_attack_steps_by_type:
+            num_attack_steps_by_type[asset.type] = len(
+                corelang_lang_graph._get_attacks_for_asset_type(asset.type)
             )
-        num_assets_attack_steps += len(attack_steps)
+        num_assets_attack_steps += num_attack_steps_by_type[asset.type]
 
     # Each attack step will get one node
-    assert len(example_attackgraph.nodes) == num_assets_attack_steps
+    assert len(attack_graph.nodes) == num_assets_attack_steps
 
 
 def test_attackgraph_according_to_corelang(corelang_lang_graph, model):
@@ -328,10 +366,12 @@ def test_attackgraph_according_to_corelang(corelang_lang_graph, model):
         "specificAccessDelete", "denyFromNetworkingAsset", "denyFromLockout"
     }
 
-    # Make sure the nodes in the AttackGraph have the expected names
-    app_attack_steps_names = {attack_step.name for attack_step in
-        attack_graph.nodes.values()}
-    assert app_attack_steps_names == expected_node_names_application
+    # Make sure the nodes in the AttackGraph have the expected names, once
+    # for each of the two applications
+    app_attack_steps_names = Counter(attack_step.name for attack_step in
+        attack_graph.nodes.values())
+    assert app_attack_steps_names == \
+        {name: 2 for name in expected_node_names_application}
 
     # notPresent is a defense step and its children are (according to corelang):
     expected_children_of_notpresent = {
@@ -358,6 +398,10 @@ def test_attackgraph_according_to_corelang(corelang_lang_graph, model):
     notpresent_children_names = {attack_step.name for attack_step in
         notpresent_attack_step.children}
     assert notpresent_children_names == expected_children_of_notpresent
+    # Children are a set, so also make sure no name is matched by the same
+    # attack step of the other application
+    assert len(notpresent_attack_step.children) == \
+        len(expected_children_of_notpresent)
 
 
 def test_attackgraph_remove_node(example_attackgraph: AttackGraph):
@@ -367,8 +411,10 @@ def test_attackgraph_remove_node(example_attackgraph: AttackGraph):
     children = list(node_to_remove.children)
     example_attackgraph.remove_node(node_to_remove)
 
-    # Make sure it was correctly removed from list of nodes
-    assert node_to_remove not in example_attackgraph.nodes.values()
+    # Make sure it was correctly removed from the nodes and the lookup dict
+    assert node_to_remove.id not in example_attackgraph.nodes
+    assert example_attackgraph.get_node_by_full_name(
+        node_to_remove.full_name) is None
 
     # Make sure it was correctly removed from parent and children references
     for parent in parents:
@@ -901,3 +947,57 @@ def test_attackgraph_remove_attacker(example_attackgraph: AttackGraph):
     attackers = list(example_attackgraph.attackers.values())
     for attacker in attackers:
         example_attackgraph.remove_attacker(attacker)
+
+
+def test_attackgraph_from_dict_missing_child(
+        example_attackgraph: AttackGraph,
+        corelang_lang_graph: LanguageGraph
+    ):
+    """Make sure a dangling child id is reported as a LookupError"""
+    serialized_graph = example_attackgraph._to_dict()
+    missing_id = example_attackgraph.next_node_id
+    first_node_dict = next(iter(serialized_graph['attack_steps'].values()))
+    first_node_dict['children'][missing_id] = 'Missing:step'
+
+    with pytest.raises(LookupError):
+        AttackGraph._from_dict(serialized_graph, corelang_lang_graph)
+
+
+def test_attackgraph_transitive_cycle():
+    test_lang_graph = LanguageGraph(MalCompiler().compile(
+        'tests/testdata/transitive.mal'))
+    test_model = Model('Test Model', test_lang_graph)
+
+    asset1 = test_model.add_asset(
+        asset_type = 'TestAsset',
+        name = 'TestAsset 1')
+    asset2 = test_model.add_asset(
+        asset_type = 'TestAsset',
+        name = 'TestAsset 2')
+    asset3 = test_model.add_asset(
+        asset_type = 'TestAsset',
+        name = 'TestAsset 3')
+
+    asset1.add_associated_assets('field2', {asset2})
+    asset2.add_associated_assets('field2', {asset3})
+    asset3.add_associated_assets('field2', {asset1})
+
+    test_attack_graph = AttackGraph(
+        lang_graph=test_lang_graph,
+        model=test_model
+    )
+
+    test_steps = [
+        test_attack_graph.get_node_by_full_name(f'{asset.name}:test_step')
+        for asset in (asset1, asset2, asset3)
+    ]
+    for test_step in test_steps:
+        assert test_step.children == set(test_steps)
+
+    # Following the chain must not change the set it was given
+    lg_test_step = test_lang_graph.assets['TestAsset'].attack_steps['test_step']
+    for _, expr_chain in lg_test_step.children['TestAsset:test_step']:
+        target_assets = {asset1}
+        assert test_attack_graph._follow_expr_chain(
+            test_model, target_assets, expr_chain) == {asset1, asset2, asset3}
+        assert target_assets == {asset1}
@@ -1,4 +1,5 @@
 """Fixtures and helpers used in several test modules"""
+import copy
 import os
 import pytest
 
@@ -29,9 +30,13 @@ def empty_model(name, lang_graph):
 
 ## Fixtures (can be ingested into tests)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def corelang_lang_graph():
-    """Fixture that returns the coreLang language specification as dict"""
+    """Fixture that returns the coreLang language specification as dict
+
+    The language graph is loaded once and shared by all tests, so tests must
+    not modify it.
+    """
     mar_file_path = path_testdata("org.mal-lang.coreLang-1.0.0.mar")
     return LanguageGraph.from_mar_archive(mar_file_path)
 
@@ -83,16 +88,16 @@ def dummy_lang_graph(corelang_lang_graph):
     return lang_graph
 
 
-@pytest.fixture
-def example_attackgraph(corelang_lang_graph: LanguageGraph, model: Model):
-    """Fixture that generates an example attack graph
-       with unattached attacker
+@pytest.fixture(scope="module")
+def example_attackgraph_template(corelang_lang_graph: LanguageGraph):
+    """Fixture that generates the example attack graph once per test module
 
-    Uses coreLang specification and model with two applications
-    with an association and an attacker to create and return
-    an AttackGraph object
+    Tests should not use this directly, since the attack graph is shared
+    between them. The example_attackgraph fixture hands out copies of it.
     """
 
+    model = empty_model('Test Model', corelang_lang_graph)
+
     # Create 2 assets
     app1 = model.add_asset(asset_type = 'Application', name = 'Application 1')
     app2 = model.add_asset(asset_type = 'Application', name = 'Application 2')
@@ -110,3 +115,18 @@ def example_attackgraph(corelang_lang_graph: LanguageGraph, model: Model):
         lang_graph=corelang_lang_graph,
         model=model
     )
+
+
+@pytest.fixture
+def example_attackgraph(example_attackgraph_template: AttackGraph):
+    """Fixture that generates an example attack graph
+       with unattached attacker
+
+    Uses coreLang specification and model with two applications
+    with an association and an attacker to create and return
+    an AttackGraph object. The attack graph is a deep copy of the module
+    wide example attack graph, so tests are free to modify it. The language
+    graph and the model are shared with the other copies.
+    """
+
+    return copy.deepcopy(example_attackgraph_template)
@@ -60,6 +60,24 @@ def test_interleaved_vars():
     assert varB2[0] == assetB
     assert varB2[1].right_link.fieldname == 'fieldB'
 
+def test_expressions_chain_is_distributive():
+    """Only chains without intersections or differences can be followed
+    from a whole set of assets at once"""
+    test_lang_graph = LanguageGraph(MalCompiler().compile(
+        'tests/testdata/set_ops.mal'))
+    origin_step = test_lang_graph.assets['SO_A'].attack_steps['originStep']
+
+    distributive = {
+        target_step_name.split(':')[-1]: expr_chain.is_distributive
+        for target_step_name, children in origin_step.children.items()
+        for _, expr_chain in children
+    }
+    assert distributive == {
+        'unionStep': True,
+        'intersectionStep': False,
+        'differenceStep': False
+    }
+
 def test_inherited_vars():
     LanguageGraph(MalCompiler().compile('tests/testdata/inherited_vars.mal'))
 
@@ -81,33 +99,22 @@ def test_attackstep_override():
     assetC4 = test_lang_graph.assets['Child4']
     assetFC = test_lang_graph.assets['FinalChild']
 
-    assert 'target1' in assetEP.attack_steps
-    assert 'target2' in assetEP.attack_steps
-    assert 'target3' in assetEP.attack_steps
-    assert 'target4' in assetEP.attack_steps
+    assert {'target1', 'target2', 'target3', 'target4'} \
+        <= assetEP.attack_steps.keys()
 
-    assert 'attackstep' in assetC1.attack_steps
-    assert 'target1' in assetC1.attack_steps
-    assert 'target2' in assetC1.attack_steps
-    assert 'target3' in assetC1.attack_steps
-    assert 'target4' in assetC1.attack_steps
+    assert {'attackstep', 'target1', 'target2', 'target3', 'target4'} \
+        <= assetC1.attack_steps.keys()
     c1_attackstep = assetC1.attack_steps['attackstep']
     assert c1_attackstep.children == {}
 
-    assert 'attackstep' in assetC2.attack_steps
-    assert 'target1' in assetC2.attack_steps
-    assert 'target2' in assetC2.attack_steps
-    assert 'target3' in assetC2.attack_steps
-    assert 'target4' in assetC2.attack_steps
+    assert {'attackstep', 'target1', 'target2', 'target3', 'target4'} \
+        <= assetC2.attack_steps.keys()
     c2_attackstep = assetC2.attack_steps['attackstep']
     assert c2_attackstep.inherits == c1_attackstep
     assert c2_attackstep.children == {}
 
-    assert 'attackstep' in assetC3.attack_steps
-    assert 'target1' in assetC3.attack_steps
-    assert 'target2' in assetC3.attack_steps
-    assert 'target3' in assetC3.attack_steps
-    assert 'target4' in assetC3.attack_steps
+    assert {'attackstep', 'target1', 'target2', 'target3', 'target4'} \
+        <= assetC3.attack_steps.keys()
     c3_attackstep = assetC3.attack_steps['attackstep']
     assert c3_attackstep.inherits == c2_attackstep
     c3_target1 = assetC3.attack_steps['target1']
@@ -119,20 +126,14 @@ def test_attackstep_override():
     assert c3_target3.full_name not in c3_attackstep.children
     assert c3_target4.full_name not in c3_attackstep.children
 
-    assert 'attackstep' in assetC4.attack_steps
-    assert 'target1' in assetC4.attack_steps
-    assert 'target2' in assetC4.attack_steps
-    assert 'target3' in assetC4.attack_steps
-    assert 'target4' in assetC4.attack_steps
+    assert {'attackstep', 'target1', 'target2', 'target3', 'target4'} \
+        <= assetC4.attack_steps.keys()
     c4_attackstep = assetC4.attack_steps['attackstep']
     assert c4_attackstep.inherits == c3_attackstep
     assert c4_attackstep.children == {}
 
-    assert 'attackstep' in assetC4.attack_steps
-    assert 'target1' in assetC4.attack_steps
-    assert 'target2' in assetC4.attack_steps
-    assert 'target3' in assetC4.attack_steps
-    assert 'target4' in assetC4.attack_steps
+    assert {'attackstep', 'target1', 'target2', 'target3', 'target4'} \
+        <= assetFC.attack_steps.keys()
     fc_attackstep = assetFC.attack_steps['attackstep']
     assert fc_attackstep.inherits == c4_attackstep
     fc_target1 = assetFC.attack_steps['target1']